@@ -1,21 +1,38 @@
 """설정 관리 모듈"""
 
+import functools
 import os
 import re
 from typing import Optional, Dict, Any
 from dotenv import load_dotenv
-import json
 from pathlib import Path
 import logging
+from ..utils import serialization
 
 load_dotenv()
 
+# 클래스 속성 초기화용 환경변수 스냅샷 (os.environ은 조회마다 키 인코딩/디코딩을 거침)
+_ENV = dict(os.environ)
+
+
+@functools.lru_cache(maxsize=None)
+def _ensure_dir(path: Path) -> Path:
+    """디렉토리를 한 번만 생성하고 이후 호출은 파일시스템 접근 없이 반환"""
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_ignore_patterns(patterns: tuple) -> "re.Pattern":
+    """무시 패턴(부분 문자열) 목록을 하나의 정규식으로 컴파일 (중복 패턴은 한 번만 포함)"""
+    return re.compile('|'.join(map(re.escape, dict.fromkeys(patterns))))
+
 
 class Config:
     """애플리케이션 설정"""
     
     # 로깅 설정
-    LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+    LOG_LEVEL = _ENV.get("LOG_LEVEL", "INFO").upper()
     
     # API 키 (검증된 형태로 저장)
     OPENROUTER_API_KEY = None
@@ -49,6 +66,7 @@ class Config:
     @classmethod
     def _initialize_api_keys(cls):
         """API 키 초기화 및 검증"""
+        # load_config()에서 실행 중에 다시 호출되므로 스냅샷(_ENV) 대신 현재 환경변수를 읽음
         raw_openrouter_key = os.getenv("OPENROUTER_API_KEY")
         raw_gemini_key = os.getenv("GEMINI_API_KEY")
         
@@ -62,64 +80,89 @@ class Config:
             logging.error("Gemini API key validation failed")
     
     # LLM 프로바이더 및 모델 설정
-    DEFAULT_PROVIDER = os.getenv("DEFAULT_PROVIDER", "ollama")
-    DEFAULT_MODEL = os.getenv("DEFAULT_MODEL", "gemma3:1b")
+    DEFAULT_PROVIDER = _ENV.get("DEFAULT_PROVIDER", "ollama")
+    DEFAULT_MODEL = _ENV.get("DEFAULT_MODEL", "gemma3:1b")
     
     # 디바운스 설정 (초 단위)
-    DEBOUNCE_DELAY = float(os.getenv("DEBOUNCE_DELAY", "3.0"))
+    DEBOUNCE_DELAY = float(_ENV.get("DEBOUNCE_DELAY", "3.0"))
     
     # 커밋 메시지 언어 설정
-    COMMIT_MESSAGE_LANGUAGE = os.getenv("COMMIT_MESSAGE_LANGUAGE", "korean")
+    COMMIT_MESSAGE_LANGUAGE = _ENV.get("COMMIT_MESSAGE_LANGUAGE", "korean")
     
     # 코드 리뷰 자동 실행 여부
-    AUTO_CODE_REVIEW = os.getenv("AUTO_CODE_REVIEW", "false").lower() == "true"
+    AUTO_CODE_REVIEW = _ENV.get("AUTO_CODE_REVIEW", "false").lower() == "true"
     
     # 캐싱 설정
-    ENABLE_CACHE = os.getenv("ENABLE_CACHE", "true").lower() == "true"
-    CACHE_TTL_SECONDS = int(os.getenv("CACHE_TTL_SECONDS", "300"))  # 5분
-    CACHE_DIR = Path(os.getenv("CACHE_DIR", ".git_commit_manager_cache"))
+    ENABLE_CACHE = _ENV.get("ENABLE_CACHE", "true").lower() == "true"
+    CACHE_TTL_SECONDS = int(_ENV.get("CACHE_TTL_SECONDS", "300"))  # 5분
+    CACHE_DIR = Path(_ENV.get("CACHE_DIR", ".git_commit_manager_cache"))
+    # 캐시 키 생성 시 헝크 라인 번호/줄 끝 공백 등 의미 없는 diff 차이 무시
+    CACHE_NORMALIZE_DIFFS = _ENV.get("CACHE_NORMALIZE_DIFFS", "true").lower() == "true"
+    # 공백/주석만 다른 diff도 같은 결과를 재사용하는 구조적 캐시 키 사용 여부
+    # (주석 문법은 확장자별로 판단하고, Python/YAML은 들여쓰기 변경을 코드 변경으로 취급)
+    ENABLE_STRUCTURAL_CACHE = _ENV.get("ENABLE_STRUCTURAL_CACHE", "true").lower() == "true"
+    
+    # 시맨틱 캐시 설정 (임베딩 유사도 기반, 선택 사항)
+    ENABLE_SEMANTIC_CACHE = _ENV.get("ENABLE_SEMANTIC_CACHE", "false").lower() == "true"
+    SEMANTIC_CACHE_THRESHOLD = float(_ENV.get("SEMANTIC_CACHE_THRESHOLD", "0.92"))
+    SEMANTIC_CACHE_MODEL = _ENV.get("SEMANTIC_CACHE_MODEL", "nomic-embed-text")
     
     # 청크 크기 설정
-    MAX_CHUNK_SIZE = int(os.getenv("MAX_CHUNK_SIZE", "2000"))
-    MAX_CONTEXT_LENGTH = int(os.getenv("MAX_CONTEXT_LENGTH", "4000"))
+    MAX_CHUNK_SIZE = int(_ENV.get("MAX_CHUNK_SIZE", "2000"))
+    MAX_CONTEXT_LENGTH = int(_ENV.get("MAX_CONTEXT_LENGTH", "4000"))
+    # 이보다 큰 단일 청크(minified 파일 등)는 리뷰하지 않음
+    MAX_REVIEW_DIFF_SIZE = int(_ENV.get("MAX_REVIEW_DIFF_SIZE", "20000"))
     
     # LLM 설정
-    LLM_TEMPERATURE = float(os.getenv("LLM_TEMPERATURE", "0.7"))
-    LLM_MAX_TOKENS = int(os.getenv("LLM_MAX_TOKENS", "500"))
-    LLM_TIMEOUT_SECONDS = int(os.getenv("LLM_TIMEOUT_SECONDS", "30"))
+    LLM_TEMPERATURE = float(_ENV.get("LLM_TEMPERATURE", "0.7"))
+    LLM_MAX_TOKENS = int(_ENV.get("LLM_MAX_TOKENS", "500"))
+    LLM_TIMEOUT_SECONDS = int(_ENV.get("LLM_TIMEOUT_SECONDS", "30"))
+    
+    # 동시 LLM 호출 수 (0이면 프로바이더 기본값: API 4, Ollama 1)
+    MAX_CONCURRENT_LLM_CALLS = int(_ENV.get("MAX_CONCURRENT_LLM_CALLS", "0"))
+    
+    # 여러 파일 리뷰를 한 번의 LLM 요청으로 묶을지 여부, 배치당 입력 토큰 예산 및 최대 파일 수
+    ENABLE_BATCH_REVIEW = _ENV.get("ENABLE_BATCH_REVIEW", "true").lower() == "true"
+    MAX_BATCH_TOKENS = int(_ENV.get("MAX_BATCH_TOKENS", "6000"))
+    REVIEW_BATCH_SIZE = int(_ENV.get("REVIEW_BATCH_SIZE", "4"))
+    
+    # 스트리밍 출력 여부 (false면 전체 응답을 받은 뒤 한 번에 표시)
+    ENABLE_STREAMING = _ENV.get("ENABLE_STREAMING", "true").lower() == "true"
     
     # 재시도 설정
-    MAX_RETRIES = int(os.getenv("MAX_RETRIES", "3"))
-    RETRY_DELAY = float(os.getenv("RETRY_DELAY", "1.0"))
+    MAX_RETRIES = int(_ENV.get("MAX_RETRIES", "3"))
+    RETRY_DELAY = float(_ENV.get("RETRY_DELAY", "1.0"))
     
     # 파일 필터링
-    IGNORE_PATTERNS = os.getenv("IGNORE_PATTERNS", ".git/,__pycache__/,.pyc,.pyo,.DS_Store,node_modules/,venv/,env/,.env").split(",")
-    MAX_FILE_SIZE_MB = float(os.getenv("MAX_FILE_SIZE_MB", "5.0"))
+    IGNORE_PATTERNS = _ENV.get("IGNORE_PATTERNS", ".git/,__pycache__/,.pyc,.pyo,.DS_Store,node_modules/,venv/,env/,.env").split(",")
+    MAX_FILE_SIZE_MB = float(_ENV.get("MAX_FILE_SIZE_MB", "5.0"))
     
     # 커스텀 프롬프트 설정 (환경변수에서 읽기)
     # 커밋 메시지 시스템 프롬프트
-    CUSTOM_COMMIT_SYSTEM_PROMPT_KOREAN = os.getenv("CUSTOM_COMMIT_SYSTEM_PROMPT_KOREAN")
-    CUSTOM_COMMIT_SYSTEM_PROMPT_ENGLISH = os.getenv("CUSTOM_COMMIT_SYSTEM_PROMPT_ENGLISH")
+    CUSTOM_COMMIT_SYSTEM_PROMPT_KOREAN = _ENV.get("CUSTOM_COMMIT_SYSTEM_PROMPT_KOREAN")
+    CUSTOM_COMMIT_SYSTEM_PROMPT_ENGLISH = _ENV.get("CUSTOM_COMMIT_SYSTEM_PROMPT_ENGLISH")
     
     # 커밋 메시지 사용자 프롬프트
-    CUSTOM_COMMIT_USER_PROMPT_KOREAN = os.getenv("CUSTOM_COMMIT_USER_PROMPT_KOREAN")
-    CUSTOM_COMMIT_USER_PROMPT_ENGLISH = os.getenv("CUSTOM_COMMIT_USER_PROMPT_ENGLISH")
+    CUSTOM_COMMIT_USER_PROMPT_KOREAN = _ENV.get("CUSTOM_COMMIT_USER_PROMPT_KOREAN")
+    CUSTOM_COMMIT_USER_PROMPT_ENGLISH = _ENV.get("CUSTOM_COMMIT_USER_PROMPT_ENGLISH")
     
     # 코드 리뷰 시스템 프롬프트
-    CUSTOM_REVIEW_SYSTEM_PROMPT_KOREAN = os.getenv("CUSTOM_REVIEW_SYSTEM_PROMPT_KOREAN")
-    CUSTOM_REVIEW_SYSTEM_PROMPT_ENGLISH = os.getenv("CUSTOM_REVIEW_SYSTEM_PROMPT_ENGLISH")
+    CUSTOM_REVIEW_SYSTEM_PROMPT_KOREAN = _ENV.get("CUSTOM_REVIEW_SYSTEM_PROMPT_KOREAN")
+    CUSTOM_REVIEW_SYSTEM_PROMPT_ENGLISH = _ENV.get("CUSTOM_REVIEW_SYSTEM_PROMPT_ENGLISH")
     
     # 코드 리뷰 사용자 프롬프트
-    CUSTOM_REVIEW_USER_PROMPT_KOREAN = os.getenv("CUSTOM_REVIEW_USER_PROMPT_KOREAN")
-    CUSTOM_REVIEW_USER_PROMPT_ENGLISH = os.getenv("CUSTOM_REVIEW_USER_PROMPT_ENGLISH")
+    CUSTOM_REVIEW_USER_PROMPT_KOREAN = _ENV.get("CUSTOM_REVIEW_USER_PROMPT_KOREAN")
+    CUSTOM_REVIEW_USER_PROMPT_ENGLISH = _ENV.get("CUSTOM_REVIEW_USER_PROMPT_ENGLISH")
     
     @classmethod
     def get_cache_dir(cls) -> Path:
-        """캐시 디렉토리 경로 반환 (없으면 생성)"""
-        cache_dir = cls.CACHE_DIR
-        if not cache_dir.exists():
-            cache_dir.mkdir(parents=True, exist_ok=True)
-        return cache_dir
+        """캐시 디렉토리 경로 반환 (없으면 생성, 경로별로 한 번만 확인)"""
+        return _ensure_dir(cls.CACHE_DIR)
+    
+    @classmethod
+    def get_ignore_regex(cls) -> "re.Pattern":
+        """IGNORE_PATTERNS 중 하나라도 포함하는 경로를 찾는 정규식 반환 (패턴 목록별로 한 번만 컴파일)"""
+        return _compile_ignore_patterns(tuple(cls.IGNORE_PATTERNS))
     
     @classmethod
     def setup_logging(cls):
@@ -144,11 +187,13 @@ class Config:
     
     @classmethod
     def to_dict(cls) -> Dict[str, Any]:
-        """현재 설정을 딕셔너리로 반환"""
+        """현재 설정을 딕셔너리로 반환 (MRO 탐색 없이 클래스 __dict__만 확인)"""
         return {
-            key: getattr(cls, key)
-            for key in dir(cls)
-            if not key.startswith('_') and not callable(getattr(cls, key))
+            key: value
+            for key, value in vars(cls).items()
+            if not key.startswith('_')
+            and not callable(value)
+            and not isinstance(value, (classmethod, staticmethod))
         }
     
     @classmethod
@@ -158,8 +203,8 @@ class Config:
         # Path 객체는 JSON 직렬화가 안되므로 문자열로 변환
         config_dict['CACHE_DIR'] = str(config_dict['CACHE_DIR'])
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(config_dict, f, indent=2, ensure_ascii=False)
+        with open(filepath, 'wb') as f:
+            f.write(serialization.dumps(config_dict, indent=True))
     
     @classmethod
     def load_config(cls, filepath: str = ".gcm_config.json"):
@@ -168,8 +213,8 @@ class Config:
             cls._initialize_api_keys()  # API 키 검증 실행
             return
             
-        with open(filepath, 'r', encoding='utf-8') as f:
-            config_dict = json.load(f)
+        with open(filepath, 'rb') as f:
+            config_dict = serialization.loads(f.read())
             
         for key, value in config_dict.items():
             if hasattr(cls, key):
@@ -1,24 +1,28 @@
 """Git Commit Manager CLI 인터페이스"""
 
 import click
+import re
 import sys
 import os#sdfffsd
-from functools import wraps
+from functools import wraps, reduce
 from pathlib import Path
-from typing import Optional, Callable, List, Dict, Any, Union
+from typing import Optional, Callable, List, Dict, Any, Union, TYPE_CHECKING
 from rich.console import Console
-from rich.prompt import Prompt, Confirm
-from rich.table import Table
-from rich.panel import Panel
-from ..serviceImpl.git_analyzer import GitAnalyzer
-from ..serviceImpl.commit_analyzer import CommitAnalyzer
-from ..serviceImpl.llm_providers import get_provider, OllamaProvider, LLMProviderError
-from ..utils.watcher import GitWatcher
 from ..config.config import Config
 
+# 무거운 모듈(GitPython, watchdog, LLM SDK, Rich 위젯)은 CLI 시작 시간을 줄이기 위해
+# 실제로 사용하는 명령어 안에서 import
+if TYPE_CHECKING:
+    from rich.panel import Panel
+    from rich.text import Text
+
 
 console = Console()
 
+# 리뷰 심각도 판별용 키워드 (대소문자 무시)
+_CRITICAL_SEVERITY_RE = re.compile(r"오류|버그|error|bug|취약|vulnerability", re.IGNORECASE)
+_WARNING_SEVERITY_RE = re.compile(r"주의|개선|warning|improve|성능", re.IGNORECASE)
+
 
 def handle_errors(f: Callable) -> Callable:
     """에러 처리 데코레이터"""
@@ -26,10 +30,6 @@ def handle_errors(f: Callable) -> Callable:
     def wrapper(*args, **kwargs):
         try:
             return f(*args, **kwargs)
-        except LLMProviderError as e:
-            console.print(f"[red]LLM 프로바이더 오류: {e}[/red]")
-            console.print("[yellow]팁: API 키나 모델 설정을 확인해주세요.[/yellow]")
-            sys.exit(1)
         except ValueError as e:
             console.print(f"[red]설정 오류: {e}[/red]")
             console.print("[yellow]팁: 저장소 경로와 설정을 확인해주세요.[/yellow]")
@@ -38,8 +38,14 @@ def handle_errors(f: Callable) -> Callable:
             console.print("\n[yellow]작업이 취소되었습니다.[/yellow]")
             sys.exit(0)
         except Exception as e:
+            # LLMProviderError가 발생했다면 모듈은 이미 로드되어 있으므로 새로 import하지 않고 확인
+            llm_providers = sys.modules.get(f"{__package__.rsplit('.', 1)[0]}.serviceImpl.llm_providers")
+            if llm_providers is not None and isinstance(e, llm_providers.LLMProviderError):
+                console.print(f"[red]LLM 프로바이더 오류: {e}[/red]")
+                console.print("[yellow]팁: API 키나 모델 설정을 확인해주세요.[/yellow]")
+                sys.exit(1)
             console.print(f"[red]예상치 못한 오류: {e}[/red]")
-            if "--debug" in sys.argv:
+            if _is_debug_enabled():
                 import traceback
                 # 민감한 정보 필터링
                 filtered_trace = traceback.format_exc()
@@ -57,8 +63,21 @@ def handle_errors(f: Callable) -> Callable:
     return wrapper
 
 
+def _is_debug_enabled() -> bool:
+    """루트 명령어의 --debug 플래그 확인"""
+    ctx = click.get_current_context(silent=True)
+    if ctx is None:
+        return False
+    root_obj = ctx.find_root().obj
+    return bool(isinstance(root_obj, dict) and root_obj.get('debug'))
+
+
 def _initialize_analysis(ctx: click.Context, provider: Optional[str], model: Optional[str], repo: str) -> None:
     """Helper to initialize GitAnalyzer, LLM provider, and CommitAnalyzer."""
+    from ..serviceImpl.git_analyzer import GitAnalyzer
+    from ..serviceImpl.commit_analyzer import CommitAnalyzer
+    from ..serviceImpl.llm_providers import get_provider
+    
     try:
         if provider is None:
             provider = Config.DEFAULT_PROVIDER
@@ -73,6 +92,8 @@ def _initialize_analysis(ctx: click.Context, provider: Optional[str], model: Opt
 
         console.print(f"[cyan]{provider} 프로바이더 초기화 중...[/cyan]")
         llm = get_provider(provider, model)
+        # 명령 종료 시 프로바이더의 HTTP 세션(연결 풀) 정리
+        ctx.call_on_close(llm.close)
         
         commit_analyzer = CommitAnalyzer(llm, git_analyzer)
 
@@ -88,13 +109,18 @@ def _initialize_analysis(ctx: click.Context, provider: Optional[str], model: Opt
         raise click.ClickException(f"초기화 오류: {e}")
 
 
+# 분석 명령어(watch/analyze/review) 공통 옵션 (위에서 아래 순서로 --help에 표시)
+_ANALYSIS_OPTIONS = (
+    click.option('--provider', '-p', type=click.Choice(['ollama', 'openrouter', 'gemini']), 
+                 help='사용할 LLM 프로바이더 (기본값: .env의 DEFAULT_PROVIDER)'),
+    click.option('--model', '-m', help='사용할 모델 이름 (기본값: .env의 DEFAULT_MODEL)'),
+    click.option('--repo', '-r', default='.', help='Git 저장소 경로'),
+    click.option('--no-cache', is_flag=True, help='캐시 사용 안함'),
+)
+
+
 def analysis_options(f: Callable[..., Any]) -> Callable[..., Any]:
     """Decorator for common analysis command options."""
-    @click.option('--provider', '-p', type=click.Choice(['ollama', 'openrouter', 'gemini']), 
-                  help='사용할 LLM 프로바이더 (기본값: .env의 DEFAULT_PROVIDER)')
-    @click.option('--model', '-m', help='사용할 모델 이름 (기본값: .env의 DEFAULT_MODEL)')
-    @click.option('--repo', '-r', default='.', help='Git 저장소 경로')
-    @click.option('--no-cache', is_flag=True, help='캐시 사용 안함')
     @wraps(f)
     def wrapper(provider: Optional[str], model: Optional[str], repo: str, no_cache: bool, *args, **kwargs):
         if no_cache:
@@ -102,13 +128,17 @@ def analysis_options(f: Callable[..., Any]) -> Callable[..., Any]:
         ctx = click.get_current_context()
         _initialize_analysis(ctx, provider, model, repo)
         return f(*args, **kwargs)
-    return wrapper
+    # 데코레이터 스택과 동일하게 마지막 옵션부터 적용
+    return reduce(lambda decorated, option: option(decorated), reversed(_ANALYSIS_OPTIONS), wrapper)
 
 
 @click.group()
 @click.option('--debug', is_flag=True, help='디버그 모드 활성화')
-def cli(debug: bool):
+@click.pass_context
+def cli(ctx: click.Context, debug: bool):
     """Git Commit Manager - AI 기반 커밋 메시지 생성 및 코드 리뷰 도구"""
+    ctx.ensure_object(dict)['debug'] = debug
+    
     # 로깅 설정 초기화
     Config.setup_logging()
     
@@ -123,6 +153,10 @@ def _check_and_suggest_ollama_model(model: Optional[str] = None) -> str:
     """Ollama 모델 확인 및 추천"""
     if model:
         return model
+    
+    from rich.panel import Panel
+    from rich.table import Table
+    from ..serviceImpl.llm_providers import OllamaProvider
         
     # 사용 가능한 모델 확인
     available_models = OllamaProvider.get_available_models()
@@ -146,7 +180,7 @@ def _check_and_suggest_ollama_model(model: Optional[str] = None) -> str:
     table.add_column("크기", style="yellow", justify="right")
     table.add_column("추천", style="cyan", justify="center")
     
-    suggested = OllamaProvider.suggest_model()
+    suggested = OllamaProvider.suggest_model(available_models)
     
     for m in available_models:
         size_gb = m.get('size', 0) / (1024**3)
@@ -174,6 +208,8 @@ def _check_and_suggest_ollama_model(model: Optional[str] = None) -> str:
 @handle_errors
 def watch():
     """Git 저장소 변경사항을 실시간으로 감시합니다."""
+    from ..utils.watcher import GitWatcher
+    
     ctx = click.get_current_context()
     git_analyzer = ctx.obj['git_analyzer']
     commit_analyzer = ctx.obj['commit_analyzer']
@@ -187,10 +223,19 @@ def watch():
 @handle_errors
 def analyze():
     """현재 변경사항을 분석하고 커밋 메시지를 생성합니다."""
+    from rich.live import Live
+    from rich.prompt import Confirm
+    from rich.text import Text
+    
     ctx = click.get_current_context()
     git_analyzer = ctx.obj['git_analyzer']
     commit_analyzer = ctx.obj['commit_analyzer']
 
+    # 변경사항이 없으면 diff 분석 없이 바로 종료
+    if not git_analyzer.has_changes():
+        console.print("[yellow]변경사항이 없습니다.[/yellow]")
+        return
+    
     changes = git_analyzer.get_all_changes()
     if not any(changes.values()):
         console.print("[yellow]변경사항이 없습니다.[/yellow]")
@@ -198,16 +243,20 @@ def analyze():
             
     _display_changes_table(changes)
     
-    with console.status("[cyan]커밋 메시지 생성 중...[/cyan]"):
-        chunks = git_analyzer.get_diff_chunks()
-        commit_message = commit_analyzer.generate_commit_message(chunks)
-    
-    console.print(Panel(
-        commit_message,
-        title="[bold green]추천 커밋 메시지[/bold green]",
-        border_style="green",
-        padding=(1, 2)
-    ))
+    if Config.ENABLE_STREAMING:
+        chunks = git_analyzer.get_diff_chunks(untracked=changes['untracked'])
+        commit_message = ""
+        # 토큰이 도착하는 대로 패널 갱신
+        with Live(_commit_message_panel(Text("커밋 메시지 생성 중...", style="dim")),
+                  console=console, refresh_per_second=20) as live:
+            for commit_message in commit_analyzer.generate_commit_message_stream(chunks):
+                live.update(_commit_message_panel(commit_message))
+    else:
+        with console.status("[cyan]커밋 메시지 생성 중...[/cyan]"):
+            chunks = git_analyzer.get_diff_chunks(untracked=changes['untracked'])
+            commit_message = commit_analyzer.generate_commit_message(chunks)
+        
+        console.print(_commit_message_panel(commit_message))
     
     if Confirm.ask("\n이 커밋 메시지를 사용하시겠습니까?"):
         # Git 명령어 생성
@@ -246,60 +295,121 @@ def review(file: Optional[str], type: str):
     git_analyzer = ctx.obj['git_analyzer']
     commit_analyzer = ctx.obj['commit_analyzer']
 
+    # 변경사항이 없으면 diff 분석 없이 바로 종료
+    if not git_analyzer.has_changes():
+        console.print("[yellow]변경사항이 없습니다.[/yellow]")
+        return
+    
     changes = git_analyzer.get_all_changes()
     if not any(changes.values()):
         console.print("[yellow]변경사항이 없습니다.[/yellow]")
         return
     
+    # 필터 조건에 맞는 청크 수 (제너레이터로 소비하므로 별도 집계)
+    matched = {'file': 0, 'all': 0}
+    
+    def filtered_chunks():
+        for c in git_analyzer.iter_diff_chunks(untracked=changes['untracked']):
+            if file and c.get('path') != file:
+                continue
+            matched['file'] += 1
+            if type != 'all' and c.get('type') != type:
+                continue
+            matched['all'] += 1
+            yield c
+    
     with console.status("[cyan]코드 리뷰 중...[/cyan]"):
-        chunks = git_analyzer.get_diff_chunks()
-        
-        # 필터링
-        if file:
-            chunks = [c for c in chunks if c.get('path') == file]
-            if not chunks:
-                console.print(f"[yellow]{file} 파일에 변경사항이 없습니다.[/yellow]")
-                return
-        
-        if type != 'all':
-            chunks = [c for c in chunks if c.get('type') == type]
-            if not chunks:
-                console.print(f"[yellow]{type} 타입의 변경사항이 없습니다.[/yellow]")
-                return
-                
-        reviews = commit_analyzer.review_code_changes(chunks)
+        if Config.ENABLE_STREAMING:
+            # 파일별 리뷰가 완료되는 대로 바로 출력
+            completed = []
+            
+            def on_review(review_item: Dict[str, str]) -> None:
+                completed.append(review_item)
+                _print_review(review_item, len(completed))
+            
+            reviews = commit_analyzer.review_code_changes(filtered_chunks(), on_review=on_review)
+        else:
+            reviews = commit_analyzer.review_code_changes(filtered_chunks())
+    
+    if file and not matched['file']:
+        console.print(f"[yellow]{file} 파일에 변경사항이 없습니다.[/yellow]")
+        return
+    if type != 'all' and not matched['all']:
+        console.print(f"[yellow]{type} 타입의 변경사항이 없습니다.[/yellow]")
+        return
     
     if not reviews:
         console.print("[green]✓ 코드가 완벽합니다! 리뷰할 내용이 없습니다.[/green]")
         return
 
+    if Config.ENABLE_STREAMING:
+        console.print(f"\n[bold]코드 리뷰 완료 ({len(reviews)}개 파일)[/bold]")
+        return
+
     console.print(f"\n[bold]코드 리뷰 결과 ({len(reviews)}개 파일)[/bold]\n")
     
     for i, review_item in enumerate(reviews, 1):
-        severity = _get_review_severity(review_item['review'])
-        border_color = {
-            'critical': 'red',
-            'warning': 'yellow',
-            'info': 'blue'
-        }.get(severity, 'blue')
-        
-        console.print(Panel(
-            f"[yellow]파일:[/yellow] {review_item['file']}\n"
-            f"[yellow]변경:[/yellow] {review_item['type']}\n"
-            f"[yellow]심각도:[/yellow] {severity}\n\n"
-            f"{review_item['review']}",
-            title=f"[bold]리뷰 {i}/{len(reviews)}[/bold]",
-            border_style=border_color,
-            padding=(1, 2)
-        ))
+        _print_review(review_item, i, len(reviews))
+
+
+def _commit_message_panel(commit_message: Union[str, "Text"]) -> "Panel":
+    """추천 커밋 메시지 패널 생성"""
+    from rich.panel import Panel
+    from rich.text import Text
+    
+    # LLM 출력은 마크업 파싱과 자동 하이라이팅 없이 그대로 표시
+    if isinstance(commit_message, str):
+        commit_message = Text(commit_message)
+    
+    return Panel(
+        commit_message,
+        title="[bold green]추천 커밋 메시지[/bold green]",
+        border_style="green",
+        padding=(1, 2)
+    )
+
+
+def _print_review(review_item: Dict[str, str], index: int, total: Optional[int] = None) -> None:
+    """리뷰 결과 패널 출력"""
+    from rich.panel import Panel
+    from rich.text import Text
+    
+    severity = _get_review_severity(review_item['review'])
+    border_color = {
+        'critical': 'red',
+        'warning': 'yellow',
+        'info': 'blue'
+    }.get(severity, 'blue')
+    title = f"리뷰 {index}/{total}" if total else f"리뷰 {index}"
+    
+    # 리뷰 본문(LLM 출력)과 파일명은 마크업 파싱/하이라이팅 없이 그대로 표시
+    body = Text.assemble(
+        ("파일:", "yellow"), f" {review_item['file']}\n",
+        ("변경:", "yellow"), f" {review_item['type']}\n",
+        ("심각도:", "yellow"), f" {severity}\n\n",
+        review_item['review']
+    )
+    also_applies_to = review_item.get('also_applies_to')
+    if also_applies_to:
+        # 동일한 diff를 가진 파일은 한 번만 리뷰하고 함께 표시
+        body.append("\n\n")
+        body.append("동일한 변경:", style="yellow")
+        body.append(f" {', '.join(also_applies_to)}")
+    
+    console.print(Panel(
+        body,
+        title=f"[bold]{title}[/bold]",
+        border_style=border_color,
+        padding=(1, 2)
+    ))
 
 
 def _get_review_severity(review_text: str) -> str:
     """리뷰 내용에서 심각도 추출"""
-    review_lower = review_text.lower()
-    if any(word in review_lower for word in ['오류', '버그', 'error', 'bug', '취약', 'vulnerability']):
+    # critical 키워드가 하나라도 있으면 위치와 관계없이 critical 우선
+    if _CRITICAL_SEVERITY_RE.search(review_text):
         return 'critical'
-    elif any(word in review_lower for word in ['주의', '개선', 'warning', 'improve', '성능']):
+    elif _WARNING_SEVERITY_RE.search(review_text):
         return 'warning'
     return 'info'
 
@@ -308,20 +418,29 @@ def _get_review_severity(review_text: str) -> str:
 @handle_errors
 def cache():
     """캐시 관리 명령어"""
-    cache_dir = Config.get_cache_dir()
-    cache_files = list(cache_dir.glob("*.json"))
+    from rich.panel import Panel
+    from rich.prompt import Confirm
     
-    if not cache_files:
+    from ..serviceImpl.commit_analyzer import CacheManager
+    
+    cache_manager = CacheManager()
+    cache_dir = cache_manager.cache_dir
+    cache_manager.prune_expired()
+    entry_count = cache_manager.count()
+    # scandir은 디렉토리 읽기와 함께 파일 정보를 가져오므로 glob + stat보다 시스템 콜이 적음
+    with os.scandir(cache_dir) as it:
+        total_size = sum(e.stat().st_size for e in it if e.is_file())
+    
+    if not entry_count:
         console.print("[yellow]캐시가 비어있습니다.[/yellow]")
         return
     
     # 캐시 통계
-    total_size = sum(f.stat().st_size for f in cache_files)
     size_mb = total_size / (1024 * 1024)
     
     console.print(Panel(
         f"캐시 디렉토리: {cache_dir}\n"
-        f"캐시 파일 수: {len(cache_files)}개\n"
+        f"캐시 항목 수: {entry_count}개\n"
         f"총 크기: {size_mb:.2f}MB\n"
         f"캐시 TTL: {Config.CACHE_TTL_SECONDS}초",
         title="[bold]캐시 정보[/bold]",
@@ -329,8 +448,7 @@ def cache():
     ))
     
     if Confirm.ask("\n캐시를 삭제하시겠습니까?", default=False):
-        for f in cache_files:
-            f.unlink()
+        cache_manager.clear()
         console.print("[green]✓ 캐시가 삭제되었습니다.[/green]")
 
 
@@ -338,6 +456,8 @@ def cache():
 @handle_errors
 def models():
     """사용 가능한 모델 목록을 표시합니다."""
+    from ..serviceImpl.llm_providers import OllamaProvider
+    
     console.print("[bold]사용 가능한 모델[/bold]\n")
     
     # Ollama 모델
@@ -374,6 +494,9 @@ def models():
 @handle_errors
 def config():
     """설정 가이드를 표시합니다."""
+    from rich.panel import Panel
+    from rich.table import Table
+    
     console.print(Panel(
         "[bold]Git Commit Manager 설정 가이드[/bold]\n\n"
         "1. [yellow]빠른 시작:[/yellow]\n"
@@ -418,48 +541,35 @@ def config():
     console.print(settings_table)
 
 
+# 변경 타입별 표시 라벨과 최대 표시 개수
+_CHANGE_TABLE_LABELS = {
+    'added': ("추가됨", 10),
+    'modified': ("수정됨", 10),
+    'deleted': ("삭제됨", 10),
+    'renamed': ("이름변경", 5),
+    'untracked': ("추적안됨", 10),
+}
+
+
 def _display_changes_table(changes: Dict[str, List[Union[str, tuple]]]) -> None:
     """변경사항을 테이블로 표시"""
+    from rich.table import Table
+    
     table = Table(title="감지된 변경사항", show_header=True, header_style="bold")
     table.add_column("상태", style="cyan", width=10)
     table.add_column("파일", style="magenta")
     
-    total_files = 0
-    
     for change_type, files in changes.items():
-        if change_type == 'added' and files:
-            for f in files[:10]:  # 최대 10개만 표시
-                table.add_row("추가됨", f)
-                total_files += 1
-            if len(files) > 10:
-                table.add_row("[dim]...[/dim]", f"[dim]외 {len(files) - 10}개[/dim]")
-        elif change_type == 'modified' and files:
-            for f in files[:10]:
-                table.add_row("수정됨", f)
-                total_files += 1
-            if len(files) > 10:
-                table.add_row("[dim]...[/dim]", f"[dim]외 {len(files) - 10}개[/dim]")
-        elif change_type == 'deleted' and files:
-            for f in files[:10]:
-                table.add_row("삭제됨", f)
-                total_files += 1
-            if len(files) > 10:
-                table.add_row("[dim]...[/dim]", f"[dim]외 {len(files) - 10}개[/dim]")
-        elif change_type == 'renamed' and files:
-            for old, new in files[:5]:
-                table.add_row("이름변경", f"{old} → {new}")
-                total_files += 1
-            if len(files) > 5:
-                table.add_row("[dim]...[/dim]", f"[dim]외 {len(files) - 5}개[/dim]")
-        elif change_type == 'untracked' and files:
-            for f in files[:10]:
-                table.add_row("추적안됨", f)
-                total_files += 1
-            if len(files) > 10:
-                table.add_row("[dim]...[/dim]", f"[dim]외 {len(files) - 10}개[/dim]")
+        if not files or change_type not in _CHANGE_TABLE_LABELS:
+            continue
+        label, limit = _CHANGE_TABLE_LABELS[change_type]
+        for item in files[:limit]:
+            table.add_row(label, f"{item[0]} → {item[1]}" if change_type == 'renamed' else item)
+        if len(files) > limit:
+            table.add_row("[dim]...[/dim]", f"[dim]외 {len(files) - limit}개[/dim]")
     
     console.print(table)
-    console.print(f"\n[bold]총 {sum(len(f) if not isinstance(f, list) else len(f) for f in changes.values())}개 파일[/bold]")
+    console.print(f"\n[bold]총 {sum(len(files) for files in changes.values())}개 파일[/bold]")
 
 
 def main():
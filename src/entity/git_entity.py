@@ -5,8 +5,8 @@ from typing import Optional, List, Dict, Any
 from enum import Enum
 
 
-class ChangeType(Enum):
-    """변경 타입 열거형"""
+class ChangeType(str, Enum):
+    """변경 타입 열거형 (str 기반이라 GitAnalyzer 청크의 'type' 문자열과 바로 비교 가능)"""
     ADDED = "added"
     MODIFIED = "modified"
     DELETED = "deleted"
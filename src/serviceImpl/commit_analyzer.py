@@ -1,76 +1,228 @@
 """커밋 메시지 생성 및 코드 리뷰 모듈"""
 
+import asyncio
+import functools
 import hashlib
+import io
+import itertools
 import json
 import logging
+import os
+import sqlite3
+import threading
 import time
 import re
-from typing import List, Dict, Optional, Tuple
+from collections import OrderedDict, defaultdict
+from typing import List, Dict, Optional, Tuple, Iterator, Iterable, Callable, Union
 from pathlib import Path
 from .llm_providers import LLMProvider
 from .git_analyzer import GitAnalyzer
+from .semantic_cache import SemanticCache
 from ..config.config import Config
 
+try:
+    import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
+
+def _new_key_hasher():
+    """캐시 키용 해시 객체 생성 (BLAKE3, 미설치 시 BLAKE2b)
+
+    보안 용도가 아닌 로컬 키이므로 SHA-256 대신 더 빠른 해시를 사용합니다.
+    """
+    if BLAKE3_AVAILABLE:
+        return blake3.blake3()
+    return hashlib.blake2b(digest_size=16)
+
+
+# 캐시 키 정규화용 패턴: 헝크 헤더의 라인 번호, index 헤더, 줄 끝 공백
+_HUNK_LINE_NUMBERS_RE = re.compile(r'^@@ -\d+(?:,\d+)? \+\d+(?:,\d+)? @@', re.MULTILINE)
+_INDEX_HEADER_RE = re.compile(r'^index [0-9a-f]+\.\.[0-9a-f]+.*(?:\n|$)', re.MULTILINE)
+_TRAILING_WHITESPACE_RE = re.compile(r'[ \t]+$', re.MULTILINE)
+
+# GitAnalyzer가 만드는 청크의 필드 (캐시 키 인코딩 시 이 순서를 사용)
+_CHUNK_KEY_FIELDS = ('type', 'path', 'old_path', 'new_path', 'binary', 'chunk_info', 'diff')
+
+# 구조적 캐시 키용 패턴: 주석만 있는 변경 라인 (언어마다 주석 문법이 달라 확장자별로 선택)
+_HASH_COMMENT_CHANGE_RE = re.compile(r'^[+-]\s*#')
+_SLASH_COMMENT_CHANGE_RE = re.compile(r'^[+-]\s*//')
+_HASH_OR_SLASH_COMMENT_CHANGE_RE = re.compile(r'^[+-]\s*(?:#|//)')
+# C/C++의 #include, #define 등은 코드이므로 //만 주석으로 취급
+_COMMENT_CHANGE_RES = {
+    **dict.fromkeys(('.py', '.pyi', '.rb', '.sh', '.yaml', '.yml', '.toml'), _HASH_COMMENT_CHANGE_RE),
+    **dict.fromkeys(('.js', '.ts', '.java', '.go', '.rs', '.c', '.cpp', '.h', '.hpp'), _SLASH_COMMENT_CHANGE_RE),
+    '.php': _HASH_OR_SLASH_COMMENT_CHANGE_RE,
+}
+# 들여쓰기가 의미를 가지는 언어 (구조적 키에서도 앞쪽 들여쓰기를 유지)
+_INDENT_SENSITIVE_EXTENSIONS = frozenset({'.py', '.pyi', '.yaml', '.yml'})
+
+# 리뷰 프롬프트에서 제외할 민감한 정보 패턴 (라인당 한 번의 정규식 검색으로 확인)
+_SENSITIVE_PATTERNS = (
+    'password', 'passwd', 'pwd', 'api_key', 'apikey', 'token', 'secret',
+    'key', 'auth', 'credential', 'private', 'session', 'jwt', 'bearer',
+    'access_token', 'refresh_token', 'client_secret', 'client_id'
+)
+_SENSITIVE_RE = re.compile('|'.join(map(re.escape, _SENSITIVE_PATTERNS)), re.IGNORECASE)
+
+# 코드 리뷰 대상 확장자와 제외할 자동 생성 파일 접미사 (str.endswith에 튜플로 전달)
+_REVIEWABLE_EXTENSIONS = ('.py', '.js', '.ts', '.java', '.cpp', '.c', '.go', '.rs', '.rb', '.php')
+_GENERATED_FILE_SUFFIXES = ('.min.js', '.bundle.js', '.lock', '.map', '-lock.json')
+_REVIEWABLE_CHANGE_TYPES = frozenset({'added', 'modified', 'untracked'})
+
+
+@functools.lru_cache(maxsize=1024)
+def _is_reviewable_path(file_path: str) -> bool:
+    """리뷰 대상 확장자이면서 자동 생성 파일이 아닌 경로인지 확인 (한 파일의 여러 청크에서 재사용)"""
+    return file_path.endswith(_REVIEWABLE_EXTENSIONS) and not file_path.endswith(_GENERATED_FILE_SUFFIXES)
+
+# LLM 응답에서 제거할 XML/HTML 태그
+_TAG_RE = re.compile(r'<[^>]+>', re.DOTALL)
+
 
 class CacheManager:
-    """분석 결과 캐싱 관리자"""
+    """분석 결과 캐싱 관리자 (캐시 디렉토리의 단일 SQLite 파일에 저장)"""
     
-    def __init__(self):
+    DB_FILE_NAME = "cache.db"
+    MEMORY_CACHE_SIZE = 256  # 메모리 캐시에 유지할 최대 항목 수
+    
+    def __init__(self, namespace: str = ""):
         self.cache_dir = Config.get_cache_dir()
         self.enabled = Config.ENABLE_CACHE
         self.ttl = Config.CACHE_TTL_SECONDS
+        # 프로바이더/모델별로 캐시를 분리하기 위한 네임스페이스
+        self.namespace = namespace
+        self.db_path = self.cache_dir / self.DB_FILE_NAME
+        # sqlite3 연결은 스레드 간에 공유할 수 없으므로 스레드별로 생성
+        self._local = threading.local()
+        self._expired_purged = False
+        # 같은 실행 중 반복 조회를 위한 메모리 LRU 캐시 (키 -> (저장 시각, 값))
+        self._memory: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._memory_lock = threading.Lock()
+    
+    def _get_connection(self) -> sqlite3.Connection:
+        """현재 스레드의 DB 연결 반환 (최초 호출 시 테이블 생성)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, isolation_level=None, timeout=5)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS kv (key TEXT PRIMARY KEY, ts REAL NOT NULL, value TEXT NOT NULL)")
+            self._local.conn = conn
+        if not self._expired_purged:
+            # 만료된 항목은 인스턴스당 한 번 일괄 삭제
+            self._expired_purged = True
+            self._delete_expired(conn)
+        return conn
     
-    def _get_cache_key(self, prefix: str, content: str) -> str:
-        """캐시 키 생성 (SHA-256 사용)"""
-        content_hash = hashlib.sha256(content.encode()).hexdigest()
-        return f"{prefix}_{content_hash}"
+    def _delete_expired(self, conn: sqlite3.Connection) -> int:
+        """TTL이 지난 항목을 한 번의 DELETE로 삭제하고 삭제된 수 반환"""
+        return conn.execute("DELETE FROM kv WHERE ts <= ?", (time.time() - self.ttl,)).rowcount
     
-    def get(self, prefix: str, content: str) -> Optional[str]:
+    def prune_expired(self) -> int:
+        """만료된 캐시 항목 삭제 (삭제된 항목 수 반환)"""
+        if not self.db_path.exists():
+            return 0
+        # 연결 시 자동 정리 대신 여기서 한 번만 삭제하여 삭제 수를 정확히 반환
+        self._expired_purged = True
+        try:
+            return self._delete_expired(self._get_connection())
+        except sqlite3.Error:
+            return 0
+    
+    def _get_cache_key(self, prefix: str, content: Union[str, bytes]) -> str:
+        """캐시 키 생성 (프로바이더+모델+내용 기준, 내용을 네임스페이스와 이어 붙이지 않고 순서대로 해시)"""
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+        hasher = _new_key_hasher()
+        hasher.update(self.namespace.encode('utf-8'))
+        hasher.update(b"\n")
+        hasher.update(content)
+        return f"{prefix}_{hasher.digest()[:16].hex()}"
+    
+    def get(self, prefix: str, content: Union[str, bytes]) -> Optional[str]:
         """캐시에서 값 가져오기"""
         if not self.enabled:
             return None
             
         cache_key = self._get_cache_key(prefix, content)
-        cache_file = self.cache_dir / f"{cache_key}.json"
+        expires_before = time.time() - self.ttl
+        
+        with self._memory_lock:
+            entry = self._memory.get(cache_key)
+            if entry is not None:
+                if entry[0] > expires_before:
+                    self._memory.move_to_end(cache_key)
+                    return entry[1]
+                del self._memory[cache_key]
         
-        if not cache_file.exists():
-            return None
-            
         try:
-            with open(cache_file, 'r', encoding='utf-8') as f:
-                cache_data = json.load(f)
-                
-            # TTL 확인
-            if time.time() - cache_data['timestamp'] > self.ttl:
-                cache_file.unlink()  # 만료된 캐시 삭제
-                return None
-                
-            return cache_data['value']
-        except Exception:
+            row = self._get_connection().execute(
+                "SELECT ts, value FROM kv WHERE key = ? AND ts > ?",
+                (cache_key, expires_before)
+            ).fetchone()
+        except sqlite3.Error:
             return None
+        if not row:
+            return None
+        
+        self._remember(cache_key, row[0], row[1])
+        return row[1]
     
-    def set(self, prefix: str, content: str, value: str):
+    def set(self, prefix: str, content: Union[str, bytes], value: str):
         """캐시에 값 저장"""
         if not self.enabled:
             return
             
         cache_key = self._get_cache_key(prefix, content)
-        cache_file = self.cache_dir / f"{cache_key}.json"
-        
+        timestamp = time.time()
+        self._remember(cache_key, timestamp, value)
         try:
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                json.dump({
-                    'timestamp': time.time(),
-                    'value': value
-                }, f, ensure_ascii=False)
-        except Exception:
-            pass  # 캐시 저장 실패는 무시
+            self._get_connection().execute(
+                "INSERT OR REPLACE INTO kv (key, ts, value) VALUES (?, ?, ?)",
+                (cache_key, timestamp, value)
+            )
+        except sqlite3.Error:
+            # 캐시 저장 실패는 무시
+            pass
+    
+    def _remember(self, cache_key: str, timestamp: float, value: str):
+        """메모리 캐시에 항목 추가 (용량 초과 시 가장 오래 사용하지 않은 항목 제거)"""
+        with self._memory_lock:
+            self._memory[cache_key] = (timestamp, value)
+            self._memory.move_to_end(cache_key)
+            if len(self._memory) > self.MEMORY_CACHE_SIZE:
+                self._memory.popitem(last=False)
+    
+    def count(self) -> int:
+        """저장된 (만료되지 않은) 캐시 항목 수"""
+        if not self.db_path.exists():
+            return 0
+        try:
+            row = self._get_connection().execute(
+                "SELECT COUNT(*) FROM kv WHERE ts > ?", (time.time() - self.ttl,)
+            ).fetchone()
+        except sqlite3.Error:
+            return 0
+        return row[0]
     
     def clear(self):
         """모든 캐시 삭제"""
-        if self.cache_dir.exists():
-            for cache_file in self.cache_dir.glob("*.json"):
-                cache_file.unlink()
+        with self._memory_lock:
+            self._memory.clear()
+        try:
+            self._get_connection().execute("DELETE FROM kv")
+        except sqlite3.Error:
+            pass
+        # 이전 버전의 파일별 JSON 캐시와 시맨틱 캐시 파일도 함께 삭제
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if entry.name.endswith('.json') and entry.is_file():
+                    try:
+                        os.unlink(entry.path)
+                    except FileNotFoundError:
+                        pass
 
 
 class PromptTemplates:
@@ -92,16 +244,17 @@ feat: add user authentication endpoint
     }
     
     # 최적화된 커밋 메시지 생성용 사용자 프롬프트
+    # 고정 지시사항을 앞에, 변경사항(가변)을 뒤에 두어 프로바이더의 프롬프트 프리픽스 캐시를 활용
     DEFAULT_COMMIT_USER_PROMPTS = {
-"korean": """### 변경사항 요약 ###
-{changes_summary}
-### 지시사항 ###
-위 변경사항에 대한 Conventional Commit 형식의 커밋 메시지를 생성하세요.""",
-
-"english": """### Change Summary ###
-{changes_summary}
-### Instructions ###
-Generate a Conventional Commit message for the changes above."""
+"korean": """### 지시사항 ###
+아래 변경사항에 대한 Conventional Commit 형식의 커밋 메시지를 생성하세요.
+### 변경사항 요약 ###
+{changes_summary}""",
+
+"english": """### Instructions ###
+Generate a Conventional Commit message for the changes below.
+### Change Summary ###
+{changes_summary}"""
     }
     
     # 최적화된 코드 리뷰용 시스템 프롬프트
@@ -136,28 +289,68 @@ Omit sections if they are not applicable."""
     }
     
     # 최적화된 코드 리뷰용 사용자 프롬프트
+    # 고정 지시사항을 앞에, 파일 정보와 diff(가변)를 뒤에 배치
     DEFAULT_REVIEW_USER_PROMPTS = {
-        "korean": """### 코드 변경사항 ###
+        "korean": """### 지시사항 ###
+아래 코드 변경사항에 대한 리뷰를 생성하세요.
+
+### 코드 변경사항 ###
 **파일:** `{file_path}`
 **변경 종류:** `{change_type}`
 
 ```diff
 {diff_content}
-```
-
-### 지시사항 ###
-위 코드 변경사항에 대한 리뷰를 생성하세요.""",
+```""",
         
-"english": """### Code Change ###
+"english": """### Instructions ###
+Generate a code review for the change below.
+
+### Code Change ###
 **File:** `{file_path}`
 **Change Type:** `{change_type}`
 
 ```diff
 {diff_content}
-```
+```"""
+    }
+
+    # 여러 파일을 한 번에 리뷰하는 배치 프롬프트 (JSON 배열로 응답 요청)
+    # 파일 수도 가변값이므로 고정 지시사항 뒤에 배치
+    DEFAULT_BATCH_REVIEW_USER_PROMPTS = {
+        "korean": """### 지시사항 ###
+아래 각 파일의 코드 변경사항을 각각 리뷰하세요.
+다른 텍스트 없이 JSON 배열로만 응답하세요. 각 항목의 형식: {{"index": 파일 번호, "review": "리뷰 내용"}}
+
+### 리뷰할 파일: {file_count}개 ###
+
+{file_sections}""",
+        
+"english": """### Instructions ###
+Review each of the code changes below.
+Respond with a JSON array only, no other text. Each item: {{"index": file number, "review": "review text"}}
+
+### Files to Review: {file_count} ###
+
+{file_sections}"""
+    }
+    
+    # 배치 프롬프트 내 파일별 섹션
+    DEFAULT_BATCH_REVIEW_SECTIONS = {
+        "korean": """### 파일 {index} ###
+**파일:** `{file_path}`
+**변경 종류:** `{change_type}`
+
+```diff
+{diff_content}
+```""",
+        
+"english": """### File {index} ###
+**File:** `{file_path}`
+**Change Type:** `{change_type}`
 
-### Instructions ###
-Generate a code review for the change above."""
+```diff
+{diff_content}
+```"""
     }
 
     @classmethod
@@ -198,116 +391,452 @@ Generate a code review for the change above."""
         return list(cls.DEFAULT_COMMIT_SYSTEM_PROMPTS.keys())
 
 
+# 언어 검사용 집합 (호출마다 키 목록을 새로 만들지 않도록)
+_SUPPORTED_LANGUAGES = frozenset(PromptTemplates.DEFAULT_COMMIT_SYSTEM_PROMPTS)
+
+
 class CommitAnalyzer:
     """AI를 사용한 커밋 분석 클래스"""
     
     # 상수 정의
     MAX_DIFF_LINES = 15  
     MAX_FILES_PER_CHUNK = 5  # 한 청크당 최대 파일 수
+    REVIEW_TOKENS_PER_FILE = 250  # 배치 리뷰에서 파일당 예상 출력 토큰 수
+    STREAM_UPDATE_INTERVAL = 0.05  # 스트리밍 중간 결과 반환 간격 (초, CLI 패널 갱신 주기와 맞춤)
     
     def __init__(self, llm_provider: LLMProvider, git_analyzer: GitAnalyzer):
         self.llm = llm_provider
         self.git = git_analyzer
-        self.cache = CacheManager()
+        self.cache = CacheManager(self._get_cache_namespace(llm_provider))
+        self.semantic_cache = SemanticCache(self._get_cache_namespace(llm_provider))
+        
+        # 설정 언어에 맞는 프롬프트는 한 번만 결정 (청크마다 딕셔너리를 다시 만들지 않도록)
+        self._commit_system_prompt = self._get_prompt(PromptTemplates.get_commit_system_prompts())
+        self._commit_user_template = self._get_prompt(PromptTemplates.get_commit_user_prompts())
+        self._review_system_prompt = self._get_prompt(PromptTemplates.get_review_system_prompts())
+        self._review_user_template = self._get_prompt(PromptTemplates.get_review_user_prompts())
+        self._batch_review_section_template = self._get_prompt(PromptTemplates.DEFAULT_BATCH_REVIEW_SECTIONS)
+        self._batch_review_user_template = self._get_prompt(PromptTemplates.DEFAULT_BATCH_REVIEW_USER_PROMPTS)
+    
+    @staticmethod
+    def _get_cache_namespace(llm_provider: LLMProvider) -> str:
+        """프로바이더와 모델 이름으로 캐시 네임스페이스 생성"""
+        model_name = getattr(llm_provider, 'model_name', '')
+        return f"{type(llm_provider).__name__}:{model_name}"
         
     def _clean_llm_output(self, text: str) -> str:
         """LLM 응답에서 불필요한 태그와 공백 제거"""
         if not isinstance(text, str):
             return ""
+        # 대부분의 응답에는 태그가 없으므로 정규식 검색 없이 바로 반환
+        if '<' not in text:
+            return text.strip()
         # <think>...</think> 블록을 포함한 모든 XML/HTML 태그 제거
-        cleaned_text = re.sub(r'<[^>]+>', '', text, flags=re.DOTALL)
-        return cleaned_text.strip()
+        return _TAG_RE.sub('', text).strip()
 
     def generate_commit_message(self, chunks: Optional[List[Dict[str, str]]] = None) -> str:
         """변경사항을 기반으로 커밋 메시지 생성"""
+        result = ""
+        for result in self._generate_commit_message(chunks, stream=False):
+            pass
+        return result
+    
+    def generate_commit_message_stream(self, chunks: Optional[List[Dict[str, str]]] = None) -> Iterator[str]:
+        """커밋 메시지를 스트리밍으로 생성 (지금까지 받은 원문을 반복 반환, 마지막 값이 정리된 최종 결과)"""
+        return self._generate_commit_message(chunks, stream=Config.ENABLE_STREAMING)
+    
+    def _generate_commit_message(self, chunks: Optional[Iterable[Dict[str, str]]], stream: bool) -> Iterator[str]:
+        """커밋 메시지 생성 공통 로직"""
         if chunks is None:
             chunks = self.git.get_diff_chunks(max_chunk_size=Config.MAX_CHUNK_SIZE)
+        elif not isinstance(chunks, list):
+            # 캐시 키 생성과 요약에 전체 청크가 필요
+            chunks = list(chunks)
             
         if not chunks:
-            return ""
+            yield ""
+            return
         
         # 캐시 확인
-        chunks_str = json.dumps(chunks, sort_keys=True)
-        cached_result = self.cache.get("commit", chunks_str)
+        chunks_str = self._get_cache_content(chunks)
+        cached_result = self._get_cached("commit", chunks, chunks_str)
         if cached_result:
-            return cached_result
+            yield cached_result
+            return
             
         # 프롬프트 생성
         system_prompt = self._build_commit_system_prompt()
         user_prompt = self._build_commit_user_prompt(chunks)
         
+        # 시맨틱 캐시 확인 (유사한 변경사항의 이전 결과 재사용)
+        semantic_result, embedding = self.semantic_cache.lookup(user_prompt)
+        if semantic_result:
+            self._set_cached("commit", chunks, chunks_str, semantic_result)
+            yield semantic_result
+            return
+        
         # 토큰 제한을 고려한 프롬프트 최적화
         if len(user_prompt) > Config.MAX_CONTEXT_LENGTH:
             user_prompt = self._optimize_prompt(user_prompt, Config.MAX_CONTEXT_LENGTH)
         
-        raw_result = self.llm.generate(user_prompt, system_prompt)
+        if stream:
+            # 조각은 리스트에 모으고, 중간 결과는 정리 없이 일정 간격으로만 합쳐서 반환 (정리는 마지막에 한 번)
+            pieces = []
+            last_update = 0.0
+            for piece in self.llm.generate_stream(user_prompt, system_prompt):
+                pieces.append(piece)
+                now = time.monotonic()
+                if now - last_update >= self.STREAM_UPDATE_INTERVAL:
+                    last_update = now
+                    yield ''.join(pieces)
+            raw_result = ''.join(pieces)
+        else:
+            raw_result = self.llm.generate(user_prompt, system_prompt)
         result = self._clean_llm_output(raw_result)
         
         # 결과 캐싱
-        self.cache.set("commit", chunks_str, result)
+        self._set_cached("commit", chunks, chunks_str, result)
+        self.semantic_cache.add(embedding, result)
         
-        return result
+        yield result
         
-    def review_code_changes(self, chunks: Optional[List[Dict[str, str]]] = None) -> List[Dict[str, str]]:
-        """변경사항에 대한 코드 리뷰 수행"""
-        if chunks is None:
-            chunks = self.git.get_diff_chunks(max_chunk_size=Config.MAX_CHUNK_SIZE)
-            
-        if not chunks:
-            logging.debug("리뷰할 청크가 없음")
-            return []
+    def review_code_changes(self, chunks: Optional[Iterable[Dict[str, str]]] = None,
+                            on_review: Optional[Callable[[Dict[str, str]], None]] = None) -> List[Dict[str, str]]:
+        """변경사항에 대한 코드 리뷰 수행 (on_review: 파일별 리뷰가 완료될 때마다 호출)"""
+        return asyncio.run(self.review_code_changes_async(chunks, on_review))
+        
+    async def review_code_changes_async(self, chunks: Optional[Iterable[Dict[str, str]]] = None,
+                                        on_review: Optional[Callable[[Dict[str, str]], None]] = None) -> List[Dict[str, str]]:
+        """변경사항에 대한 코드 리뷰를 동시에 수행 (LLM 호출을 병렬화)
         
-        logging.debug(f"총 {len(chunks)}개의 청크를 리뷰 대상으로 확인 중...")
+        chunks는 제너레이터여도 되며, 배치가 채워지는 대로 LLM 호출을 시작하므로
+        나머지 청크의 diff 생성과 리뷰 요청이 겹쳐서 진행됩니다.
+        """
+        if chunks is None:
+            chunks = self.git.iter_diff_chunks(max_chunk_size=Config.MAX_CHUNK_SIZE)
         
-        reviews = []
         system_prompt = self._build_review_system_prompt()
-        reviewable_chunks = 0
-        skipped_chunks = 0
-        cache_hits = 0
-        
-        # 청크를 배치로 처리하여 효율성 향상
-        for i, chunk in enumerate(chunks):
-            file_path = chunk.get('path', 'unknown')
-            change_type = chunk.get('type', 'unknown')
-            diff_size = len(chunk.get('diff', ''))
-            
-            if self._should_review_chunk(chunk):
-                reviewable_chunks += 1
-                logging.debug(f"청크 {i+1}/{len(chunks)}: {file_path} ({change_type}) - diff 크기: {diff_size}자 - 리뷰 대상")
+        semaphore = asyncio.Semaphore(self._get_max_concurrency())
+        stats = {'total': 0, 'reviewable': 0, 'skipped': 0, 'cache_hits': 0, 'duplicates': 0}
+        # 리뷰 결과는 원래 청크 순서대로 채움
+        reviews: List[Optional[Dict[str, str]]] = []
+        # diff 해시 -> 같은 diff를 가진 다른 파일 목록 (리뷰는 첫 파일에서 한 번만 수행)
+        duplicate_files: Dict[bytes, List[str]] = {}
+        duplicates_by_index: Dict[int, List[str]] = {}
+        # 청크를 끝까지 읽기 전에 끝난 리뷰는 이후 청크가 also_applies_to에 추가될 수 있으므로 보류
+        deferred_reviews: List[Dict[str, str]] = []
+        chunks_exhausted = False
+        
+        def notify(review: Dict[str, str]):
+            """청크를 모두 읽은 뒤에만 on_review 호출 (그 전에 끝난 리뷰는 보류)"""
+            if not on_review:
+                return
+            if chunks_exhausted:
+                on_review(review)
+            else:
+                deferred_reviews.append(review)
+        
+        def pending_chunks() -> Iterator[Tuple[int, Dict[str, str], bytes]]:
+            """캐시에 없는 리뷰 대상 청크를 순서대로 생성"""
+            for i, chunk in enumerate(chunks):
+                stats['total'] += 1
+                file_path = chunk.get('path', 'unknown')
+                change_type = chunk.get('type', 'unknown')
+                diff_size = len(chunk.get('diff', ''))
+                
+                skip_reason = self._get_skip_reason(chunk)
+                if skip_reason is not None:
+                    stats['skipped'] += 1
+                    logging.debug(f"청크 {i+1}: {file_path} ({change_type}) - 스킵됨 - 이유: {skip_reason}")
+                    continue
+                
+                stats['reviewable'] += 1
+                logging.debug(f"청크 {i+1}: {file_path} ({change_type}) - diff 크기: {diff_size}자 - 리뷰 대상")
+                
+                # 동일한 diff는 한 번만 리뷰하고 결과를 공유
+                hasher = _new_key_hasher()
+                hasher.update(chunk.get('diff', '').encode('utf-8'))
+                diff_hash = hasher.digest()
+                if diff_hash in duplicate_files:
+                    stats['duplicates'] += 1
+                    duplicate_files[diff_hash].append(file_path)
+                    logging.debug(f"청크 {i+1}: {file_path} - 이전 청크와 동일한 diff, 리뷰 재사용")
+                    continue
+                also_applies_to = duplicate_files[diff_hash] = []
                 
                 # 캐시 확인
-                chunk_str = json.dumps(chunk, sort_keys=True)
-                cached_review = self.cache.get("review", chunk_str)
+                chunk_str = self._get_cache_content(chunk)
+                cached_review = self._get_cached("review", chunk, chunk_str)
                 
                 if cached_review:
-                    cache_hits += 1
+                    stats['cache_hits'] += 1
                     logging.debug(f"캐시에서 리뷰 결과 조회: {file_path}")
-                    reviews.append({
+                    review = {
                         'file': chunk['path'],
                         'type': chunk['type'],
-                        'review': cached_review
-                    })
+                        'review': cached_review,
+                        'also_applies_to': also_applies_to
+                    }
+                    reviews.append(review)
+                    notify(review)
                 else:
-                    logging.debug(f"새로운 리뷰 생성 시작: {file_path}")
-                    review_response = self._review_single_chunk(chunk, system_prompt)
-                    # review_response가 딕셔너리이므로 'review' 키에서 텍스트를 가져와 클린징
-                    cleaned_review = self._clean_llm_output(review_response.get('review', ''))
-                    review_response['review'] = cleaned_review
-                    
-                    reviews.append(review_response)
-                    # 리뷰 캐싱
-                    self.cache.set("review", chunk_str, cleaned_review)
-                    logging.debug(f"리뷰 완료 및 캐시 저장: {file_path}")
-            else:
-                skipped_chunks += 1
-                # 스킵 이유 로깅
-                skip_reason = self._get_skip_reason(chunk)
-                logging.debug(f"청크 {i+1}/{len(chunks)}: {file_path} ({change_type}) - 스킵됨 - 이유: {skip_reason}")
+                    reviews.append(None)
+                    duplicates_by_index[len(reviews) - 1] = also_applies_to
+                    yield len(reviews) - 1, chunk, chunk_str
         
-        logging.debug(f"리뷰 처리 완료 - 총 청크: {len(chunks)}, 리뷰 대상: {reviewable_chunks}, 스킵: {skipped_chunks}, 캐시 히트: {cache_hits}")
+        async def run_batch(batch: List[Tuple[int, Dict[str, str], bytes]]):
+            if len(batch) > 1:
+                results = await self.review_batch_async(batch, system_prompt, semaphore)
+            else:
+                _, chunk, chunk_str = batch[0]
+                results = [await self.review_chunk_async(chunk, system_prompt, chunk_str, semaphore)]
+            for (index, _, _), review in zip(batch, results):
+                review['also_applies_to'] = duplicates_by_index[index]
+                reviews[index] = review
+                notify(review)
+        
+        if Config.ENABLE_BATCH_REVIEW:
+            batches = self._pack_review_batches(pending_chunks())
+        else:
+            batches = ([item] for item in pending_chunks())
+        
+        tasks = []
+        for batch in batches:
+            tasks.append(asyncio.ensure_future(run_batch(batch)))
+            # 다음 청크를 준비하는 동안 방금 만든 배치의 LLM 호출이 시작되도록 양보
+            await asyncio.sleep(0)
+        
+        # 모든 중복 파일이 모였으므로 보류한 리뷰부터 전달
+        chunks_exhausted = True
+        for review in deferred_reviews:
+            on_review(review)
+        
+        # 일부 청크가 실패해도 나머지 요청은 끝까지 진행한 뒤 첫 오류를 전달
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        errors = [r for r in results if isinstance(r, BaseException)]
+        if errors:
+            raise errors[0]
+        
+        if not stats['total']:
+            logging.debug("리뷰할 청크가 없음")
+        logging.debug(f"리뷰 처리 완료 - 총 청크: {stats['total']}, 리뷰 대상: {stats['reviewable']}, 스킵: {stats['skipped']}, 중복: {stats['duplicates']}, 캐시 히트: {stats['cache_hits']}, LLM 요청: {len(tasks)}")
         
         return reviews
     
+    async def review_chunk_async(self, chunk: Dict[str, str], system_prompt: str, chunk_str: bytes,
+                                 semaphore: asyncio.Semaphore) -> Dict[str, str]:
+        """개별 청크 리뷰를 스레드 풀에서 실행 (동시 실행 수는 세마포어로 제한)"""
+        file_path = chunk.get('path', 'unknown')
+        user_prompt = self._build_review_user_prompt(chunk)
+        async with semaphore:
+            logging.debug(f"새로운 리뷰 생성 시작: {file_path}")
+            raw_review = await self.llm.agenerate(user_prompt, system_prompt)
+        
+        cleaned_review = self._clean_llm_output(raw_review)
+        
+        # 리뷰 캐싱
+        self._set_cached("review", chunk, chunk_str, cleaned_review)
+        logging.debug(f"리뷰 완료 및 캐시 저장: {file_path}")
+        return {
+            'file': chunk['path'],
+            'type': chunk['type'],
+            'review': cleaned_review
+        }
+    
+    async def review_batch_async(self, batch: List[Tuple[int, Dict[str, str], bytes]], system_prompt: str,
+                                 semaphore: asyncio.Semaphore) -> List[Dict[str, str]]:
+        """여러 청크를 한 번의 LLM 호출로 리뷰 (응답 파싱 실패 시 개별 리뷰로 대체)
+
+        프로바이더 오류(속도 제한, 연결 실패 등)는 개별 요청으로 늘려 재시도하지 않고 그대로 전달합니다.
+        """
+        user_prompt = self._build_batch_review_user_prompt([chunk for _, chunk, _ in batch])
+        async with semaphore:
+            logging.debug(f"배치 리뷰 생성 시작: {len(batch)}개 파일")
+            raw_response = await self.llm.agenerate(user_prompt, system_prompt)
+        parsed = self._parse_batch_reviews(raw_response)
+        
+        results = []
+        for number, (_, chunk, chunk_str) in enumerate(batch, 1):
+            review_text = parsed.get(number)
+            if not review_text:
+                # 배치 응답에서 누락된 파일은 개별 요청으로 처리
+                logging.debug(f"배치 응답에 리뷰 누락, 개별 리뷰로 대체: {chunk.get('path')}")
+                results.append(await self.review_chunk_async(chunk, system_prompt, chunk_str, semaphore))
+                continue
+            
+            review = {
+                'file': chunk['path'],
+                'type': chunk['type'],
+                'review': review_text
+            }
+            self._set_cached("review", chunk, chunk_str, review_text)
+            results.append(review)
+        return results
+    
+    def _build_batch_review_user_prompt(self, chunks: List[Dict[str, str]]) -> str:
+        """여러 파일을 번호를 매긴 섹션으로 묶은 배치 리뷰 프롬프트 생성"""
+        sections = [
+            self._batch_review_section_template.format(
+                index=number,
+                file_path=chunk['path'],
+                change_type=chunk['type'],
+                diff_content=self._prepare_diff_content(chunk)
+            )
+            for number, chunk in enumerate(chunks, 1)
+        ]
+        return self._batch_review_user_template.format(
+            file_count=len(chunks),
+            file_sections="\n\n".join(sections)
+        )
+    
+    def _parse_batch_reviews(self, raw_response: str) -> Dict[int, str]:
+        """배치 리뷰 응답(JSON 배열) 파싱"""
+        if not isinstance(raw_response, str):
+            return {}
+        start, end = raw_response.find('['), raw_response.rfind(']')
+        if start == -1 or end <= start:
+            logging.debug("배치 리뷰 응답에서 JSON 배열을 찾을 수 없음")
+            return {}
+        try:
+            items = json.loads(raw_response[start:end + 1])
+        except ValueError:
+            logging.debug("배치 리뷰 응답 JSON 파싱 실패")
+            return {}
+        
+        parsed = {}
+        for item in items if isinstance(items, list) else []:
+            if isinstance(item, dict) and isinstance(item.get('index'), int) and isinstance(item.get('review'), str):
+                review_text = self._clean_llm_output(item['review'])
+                if review_text:
+                    parsed[item['index']] = review_text
+        return parsed
+    
+    def _pack_review_batches(self, pending: Iterable[Tuple[int, Dict[str, str], bytes]]) -> Iterator[List[Tuple[int, Dict[str, str], bytes]]]:
+        """리뷰 대상 청크를 토큰 예산 내에서 배치로 묶음 (그리디, 배치가 차는 대로 반환)"""
+        # 출력 토큰 한도 내에서 파일별 리뷰가 잘리지 않도록 파일 수도 제한
+        max_files = max(1, min(Config.REVIEW_BATCH_SIZE, Config.LLM_MAX_TOKENS // self.REVIEW_TOKENS_PER_FILE))
+        # 루프 안에서 매번 클래스 속성을 조회하지 않도록 호출 시점의 설정값을 지역 변수로 고정
+        max_chunk_size = Config.MAX_CHUNK_SIZE
+        max_batch_tokens = Config.MAX_BATCH_TOKENS
+        estimate_tokens = self._estimate_tokens
+        current: List[Tuple[int, Dict[str, str], bytes]] = []
+        current_tokens = 0
+        
+        for item in pending:
+            tokens = estimate_tokens(min(len(item[1].get('diff', '')), max_chunk_size))
+            if current and (current_tokens + tokens > max_batch_tokens or len(current) >= max_files):
+                yield current
+                current, current_tokens = [], 0
+            current.append(item)
+            current_tokens += tokens
+        
+        if current:
+            yield current
+    
+    @staticmethod
+    def _estimate_tokens(char_count: int) -> int:
+        """문자 수로 토큰 수 근사 (약 4자당 1토큰)"""
+        return char_count // 4 + 1
+    
+    def _get_max_concurrency(self) -> int:
+        """동시 LLM 호출 수 (설정값이 없으면 프로바이더 기본값)"""
+        if Config.MAX_CONCURRENT_LLM_CALLS > 0:
+            return Config.MAX_CONCURRENT_LLM_CALLS
+        return max(1, getattr(self.llm, 'max_concurrency', 1))
+    
+    def _get_cache_content(self, chunks) -> bytes:
+        """캐시 키 생성용 다이제스트 (청크 하나 또는 청크 목록, 한 번만 계산해 조회/저장에 재사용)"""
+        if isinstance(chunks, dict):
+            chunks = [chunks]
+        if Config.CACHE_NORMALIZE_DIFFS:
+            chunks = [self._normalize_chunk_for_cache(c) for c in chunks]
+        return self._digest_chunks_for_key(chunks)
+    
+    @staticmethod
+    def _digest_chunks_for_key(chunks: Iterable[Dict[str, str]]) -> bytes:
+        """청크 목록을 캐시 키용 다이제스트로 변환 (JSON 직렬화/키 정렬 없이)
+        
+        청크 스키마가 고정되어 있으므로 필드를 정해진 순서로 나열하고,
+        각 값 앞에 길이를 붙여 구분자 충돌 없이 해시에 바로 흘려 넣습니다.
+        전체 diff를 하나의 문자열로 이어 붙인 복사본은 만들지 않습니다.
+        """
+        hasher = _new_key_hasher()
+        for chunk in chunks:
+            # 스키마 밖의 필드가 있으면 이름순으로 뒤에 추가
+            fields = _CHUNK_KEY_FIELDS + tuple(sorted(k for k in chunk if k not in _CHUNK_KEY_FIELDS))
+            for field in fields:
+                value = chunk.get(field)
+                value = '' if value is None else str(value)
+                hasher.update(f"{len(field)}:{field}{len(value)}:".encode('utf-8'))
+                hasher.update(value.encode('utf-8'))
+            hasher.update(b"\n")
+        return hasher.digest()
+    
+    def _get_cached(self, prefix: str, chunks, cache_content: bytes) -> Optional[str]:
+        """정확한 캐시 키로 먼저 조회하고, 없으면 구조적 키로 조회"""
+        cached = self.cache.get(prefix, cache_content)
+        if cached:
+            return cached
+        fingerprint = self._get_structural_fingerprint(chunks)
+        if fingerprint is None:
+            return None
+        cached = self.cache.get(f"{prefix}_structural", fingerprint)
+        if cached:
+            logging.debug("구조적 캐시 히트 (공백/주석만 다른 변경사항)")
+        return cached
+    
+    def _set_cached(self, prefix: str, chunks, cache_content: bytes, value: str):
+        """정확한 캐시 키와 구조적 키 모두에 저장"""
+        self.cache.set(prefix, cache_content, value)
+        fingerprint = self._get_structural_fingerprint(chunks)
+        if fingerprint is not None:
+            self.cache.set(f"{prefix}_structural", fingerprint, value)
+    
+    def _get_structural_fingerprint(self, chunks) -> Optional[bytes]:
+        """공백과 주석 변경을 무시한 구조적 캐시 키 (주석만 바뀐 경우 None)"""
+        if not Config.ENABLE_STRUCTURAL_CACHE:
+            return None
+        chunk_list = [chunks] if isinstance(chunks, dict) else chunks
+        
+        fingerprints = []
+        has_code_change = False
+        for chunk in chunk_list:
+            extension = os.path.splitext(chunk.get('path') or '')[1].lower()
+            # 주석 문법을 모르는 파일은 주석 라인도 코드로 취급
+            comment_re = _COMMENT_CHANGE_RES.get(extension)
+            keep_indent = extension in _INDENT_SENSITIVE_EXTENSIONS
+            lines = []
+            for line in self._normalize_chunk_for_cache(chunk).get('diff', '').split('\n'):
+                if comment_re is not None and comment_re.match(line):
+                    continue
+                if line.startswith(('+', '-')) and not line.startswith(('+++', '---')):
+                    has_code_change = True
+                if keep_indent:
+                    # diff 표시 문자 뒤의 들여쓰기는 유지하고 나머지 연속 공백만 축약
+                    body = line[1:]
+                    rest = body.lstrip()
+                    lines.append(line[:1] + body[:len(body) - len(rest)] + ' '.join(rest.split()))
+                else:
+                    # 들여쓰기 제거 및 연속 공백을 하나로 축약
+                    lines.append(' '.join(line.split()))
+            fingerprints.append({'path': chunk.get('path'), 'type': chunk.get('type'), 'diff': '\n'.join(lines)})
+        
+        # 주석만 바뀐 변경사항끼리 같은 키를 공유하지 않도록 제외
+        if not has_code_change:
+            return None
+        return self._digest_chunks_for_key(fingerprints)
+    
+    @staticmethod
+    def _normalize_chunk_for_cache(chunk: Dict[str, str]) -> Dict[str, str]:
+        """리뷰 결과에 영향이 없는 diff 차이(라인 번호 이동, blob 해시, 줄 끝 공백) 제거"""
+        diff = chunk.get('diff')
+        if not diff:
+            return chunk
+        diff = _HUNK_LINE_NUMBERS_RE.sub('@@', diff)
+        diff = _INDEX_HEADER_RE.sub('', diff)
+        diff = _TRAILING_WHITESPACE_RE.sub('', diff)
+        return {**chunk, 'diff': diff}
+    
     def clear_cache(self):
         """캐시 초기화"""
         self.cache.clear()
@@ -317,200 +846,178 @@ class CommitAnalyzer:
         if len(prompt) <= max_length:
             return prompt
             
-        # 중요한 부분을 유지하면서 길이 축소
-        lines = prompt.split('\n')
-        optimized_lines = []
-        current_length = 0
-        
-        # 파일 정보와 주요 변경사항 우선 포함
-        for line in lines:
-            if current_length + len(line) > max_length:
-                if optimized_lines:
-                    optimized_lines.append("... (일부 내용 생략)")
-                break
-            optimized_lines.append(line)
-            current_length += len(line) + 1
-            
-        return '\n'.join(optimized_lines)
+        # 앞부분(파일 정보와 주요 변경사항)을 줄 단위로 유지하면서 길이 축소:
+        # max_length 안에서 끝나는 마지막 줄바꿈 위치에서 자름 (줄 목록을 만들지 않음)
+        cut = prompt.rfind('\n', 0, max_length + 1)
+        if cut == -1:
+            return ""
+        return prompt[:cut] + "\n... (일부 내용 생략)"
     
     def _get_prompt(self, prompt_dict: Dict[str, str]) -> str:
         """설정 언어에 맞는 프롬프트 반환"""
         language = Config.COMMIT_MESSAGE_LANGUAGE.lower()
-        supported_languages = PromptTemplates.get_supported_languages()
-
-        if language not in supported_languages:
+        if language not in _SUPPORTED_LANGUAGES:
             language = "english" # 기본값
             
         return prompt_dict[language]
 
     def _build_commit_system_prompt(self) -> str:
         """커밋 메시지 생성용 시스템 프롬프트 구성"""
-        return self._get_prompt(PromptTemplates.get_commit_system_prompts())
+        return self._commit_system_prompt
     
     def _build_commit_user_prompt(self, chunks: List[Dict[str, str]]) -> str:
         """커밋 메시지 생성용 사용자 프롬프트 구성"""
         changes_summary = self._summarize_changes(chunks)
-        prompt_template = self._get_prompt(PromptTemplates.get_commit_user_prompts())
-        return prompt_template.format(changes_summary=changes_summary)
+        return self._commit_user_template.format(changes_summary=changes_summary)
     
     def _build_review_system_prompt(self) -> str:
         """코드 리뷰용 시스템 프롬프트 구성"""
-        return self._get_prompt(PromptTemplates.get_review_system_prompts())
+        return self._review_system_prompt
     
-    def _review_single_chunk(self, chunk: Dict[str, str], system_prompt: str) -> Dict[str, str]:
-        """개별 청크에 대한 코드 리뷰 수행"""
-        prompt_template = self._get_prompt(PromptTemplates.get_review_user_prompts())
-        
-        # diff 내용 최적화
-        diff_content = chunk['diff']
-        if len(diff_content) > Config.MAX_CHUNK_SIZE:
-            diff_content = self._extract_important_diff(diff_content, Config.MAX_CHUNK_SIZE)
-        
-        user_prompt = prompt_template.format(
+    def _build_review_user_prompt(self, chunk: Dict[str, str]) -> str:
+        """개별 청크 리뷰용 사용자 프롬프트 생성"""
+        return self._review_user_template.format(
             file_path=chunk['path'],
             change_type=chunk['type'],
-            diff_content=diff_content
+            diff_content=self._prepare_diff_content(chunk)
         )
-        
-        raw_review = self.llm.generate(user_prompt, system_prompt)
-        cleaned_review = self._clean_llm_output(raw_review)
-        
-        return {
-            'file': chunk['path'],
-            'type': chunk['type'],
-            'review': cleaned_review
-        }
+    
+    def _prepare_diff_content(self, chunk: Dict[str, str]) -> str:
+        """리뷰 프롬프트에 넣을 diff 내용 최적화"""
+        diff_content = chunk['diff']
+        if len(diff_content) > Config.MAX_CHUNK_SIZE:
+            diff_content = self._extract_important_diff(diff_content, Config.MAX_CHUNK_SIZE)
+        return diff_content
     
     def _extract_important_diff(self, diff: str, max_size: int) -> str:
         """중요한 diff 부분만 추출 (보안 및 성능 개선)"""
         if not diff or max_size <= 0:
             return ""
             
-        lines = diff.split('\n')
         important_lines = []
+        context_lines = []  # 앞쪽 컨텍스트 라인 (최대 10개)
         current_size = 0
+        collecting_changes = True
         
-        # 추가/삭제된 라인 우선 포함 (보안 검사 포함)
-        for line in lines:
-            # 민감한 정보가 포함된 라인 필터링 (확장된 패턴)
-            sensitive_patterns = [
-                'password', 'passwd', 'pwd', 'api_key', 'apikey', 'token', 'secret', 
-                'key', 'auth', 'credential', 'private', 'session', 'jwt', 'bearer',
-                'access_token', 'refresh_token', 'client_secret', 'client_id'
-            ]
-            if any(sensitive in line.lower() for sensitive in sensitive_patterns):
-                line = "... (민감한 정보가 포함된 라인 제외됨)"
+        # 한 번의 순회로 추가/삭제 라인과 컨텍스트 라인을 함께 수집 (라인 목록을 만들지 않음)
+        for line in io.StringIO(diff):
+            line = line.rstrip('\n')
             
-            if line.startswith(('+', '-')) and not line.startswith(('+++', '---')):
-                if current_size + len(line) > max_size:
-                    break
-                important_lines.append(line)
-                current_size += len(line) + 1
-                
-                # 라인 수 제한 (DOS 방지)
-                if len(important_lines) > 100:
-                    important_lines.append("... (너무 많은 변경사항으로 일부 생략)")
+            if not line.startswith(('+', '-')):
+                if len(context_lines) < 10:
+                    # 민감한 정보가 포함된 라인 필터링
+                    if _SENSITIVE_RE.search(line):
+                        line = "... (민감한 정보가 포함된 라인 제외됨)"
+                    context_lines.append(line)
+                elif not collecting_changes:
                     break
+                continue
+            
+            # 추가/삭제된 라인 우선 포함 (민감한 정보가 포함된 라인과 파일 헤더는 제외)
+            if not collecting_changes or line.startswith(('+++', '---')) or _SENSITIVE_RE.search(line):
+                continue
+            if current_size + len(line) > max_size:
+                collecting_changes = False
+                continue
+            important_lines.append(line)
+            current_size += len(line) + 1
+            
+            # 라인 수 제한 (DOS 방지)
+            if len(important_lines) > 100:
+                important_lines.append("... (너무 많은 변경사항으로 일부 생략)")
+                collecting_changes = False
+        
+        # split('\n')과 동일하게 마지막 개행 뒤의 빈 라인도 컨텍스트로 취급
+        if diff.endswith('\n') and len(context_lines) < 10:
+            context_lines.append('')
         
         # 컨텍스트 라인 추가
         remaining_size = max_size - current_size
         if remaining_size > 0:
-            context_lines = [l for l in lines if not l.startswith(('+', '-'))]
-            
-            for line in context_lines[:min(10, remaining_size // 50)]:  # 최대 10라인, 평균 라인 길이 50 가정
-                important_lines.append(line)
+            important_lines.extend(context_lines[:min(10, remaining_size // 50)])  # 최대 10라인, 평균 라인 길이 50 가정
             
         return '\n'.join(important_lines)
     
     def _should_review_chunk(self, chunk: Dict[str, str]) -> bool:
         """청크가 리뷰 대상인지 확인"""
-        # 바이너리 파일이나 큰 파일은 제외
-        if chunk.get('binary', False):
-            return False
-            
-        # 특정 파일 타입만 리뷰
-        reviewable_extensions = {'.py', '.js', '.ts', '.java', '.cpp', '.c', '.go', '.rs', '.rb', '.php'}
-        file_path = chunk.get('path', '')
-        
-        if any(file_path.endswith(ext) for ext in reviewable_extensions):
-            return chunk['type'] in ['added', 'modified', 'untracked']
-            
-        return False
+        return self._get_skip_reason(chunk) is None
     
-    def _get_skip_reason(self, chunk: Dict[str, str]) -> str:
-        """청크가 스킵된 이유를 반환"""
-        # 바이너리 파일 체크
+    def _get_skip_reason(self, chunk: Dict[str, str]) -> Optional[str]:
+        """청크가 스킵되는 이유를 반환 (리뷰 대상이면 None, 판정과 이유를 한 번에 계산)"""
+        # 바이너리 파일이나 큰 파일은 제외
         if chunk.get('binary', False):
             return "바이너리 파일"
         
-        file_path = chunk.get('path', '')
-        change_type = chunk.get('type', '')
+        diff_size = len(chunk.get('diff', ''))
+        if diff_size > Config.MAX_REVIEW_DIFF_SIZE:
+            return f"너무 큰 변경사항 ({diff_size}자 > {Config.MAX_REVIEW_DIFF_SIZE}자)"
         
-        # 파일 확장자 체크
-        reviewable_extensions = {'.py', '.js', '.ts', '.java', '.cpp', '.c', '.go', '.rs', '.rb', '.php'}
-        if not any(file_path.endswith(ext) for ext in reviewable_extensions):
+        # 특정 파일 타입만 리뷰 (자동 생성 파일 제외)
+        file_path = chunk.get('path', '')
+        if not _is_reviewable_path(file_path):
+            if file_path.endswith(_GENERATED_FILE_SUFFIXES):
+                return "자동 생성 파일"
             return f"지원하지 않는 파일 타입 ({Path(file_path).suffix or '확장자 없음'})"
         
         # 변경 타입 체크
-        if change_type not in ['added', 'modified', 'untracked']:
+        change_type = chunk.get('type', '')
+        if change_type not in _REVIEWABLE_CHANGE_TYPES:
             return f"리뷰 대상이 아닌 변경 타입 ({change_type})"
         
-        return "알 수 없는 이유"
+        return None
     
     def _summarize_changes(self, chunks: List[Dict[str, str]]) -> str:
         """변경사항을 요약하여 문자열로 반환"""
-        summary_parts = []
+        # 하나의 리스트에 모든 줄을 모은 뒤 마지막에 한 번만 join
+        summary_parts: List[str] = []
         
-        # 파일별로 그룹화
-        file_changes: Dict[str, List[Dict[str, str]]] = {}
+        # 파일별로 그룹화 (한 번의 순회)
+        file_changes: Dict[str, List[Dict[str, str]]] = defaultdict(list)
         for chunk in chunks:
-            path = chunk.get('path', chunk.get('old_path', 'unknown'))
-            if path not in file_changes:
-                file_changes[path] = []
-            file_changes[path].append(chunk)
+            file_changes[chunk.get('path', chunk.get('old_path', 'unknown'))].append(chunk)
             
-        # 파일별 변경사항 요약 생성 (최대 파일 수 제한)
-        for i, (file_path, changes) in enumerate(file_changes.items()):
-            if i >= self.MAX_FILES_PER_CHUNK:
-                summary_parts.append(f"\n... 외 {len(file_changes) - i}개 파일")
-                break
-            summary_parts.extend(self._summarize_file_changes(file_path, changes))
+        # 파일별 변경사항 요약 생성 (최대 파일 수까지만 처리)
+        for file_path, changes in itertools.islice(file_changes.items(), self.MAX_FILES_PER_CHUNK):
+            self._append_file_changes(summary_parts, file_path, changes)
+        
+        if len(file_changes) > self.MAX_FILES_PER_CHUNK:
+            summary_parts.append(f"\n... 외 {len(file_changes) - self.MAX_FILES_PER_CHUNK}개 파일")
                         
         return '\n'.join(summary_parts)
     
-    def _summarize_file_changes(self, file_path: str, changes: List[Dict[str, str]]) -> List[str]:
-        """개별 파일의 변경사항 요약"""
-        summary_parts = [f"\n파일: {file_path}"]
+    def _append_file_changes(self, parts: List[str], file_path: str, changes: List[Dict[str, str]]) -> None:
+        """개별 파일의 변경사항 요약을 parts에 추가"""
+        parts.append(f"\n파일: {file_path}")
         
         for change in changes:
             if change['type'] == 'renamed':
-                summary_parts.append(f"- 이름변경: {change['old_path']} → {change['new_path']}")
+                parts.append(f"- 이름변경: {change['old_path']} → {change['new_path']}")
             else:
-                summary_parts.append(f"- {change['type']}")
+                parts.append(f"- {change['type']}")
                 
                 if 'diff' in change and change['diff']:
-                    summary_parts.extend(self._format_diff_preview(change['diff']))
-                    
-        return summary_parts
+                    self._append_diff_preview(parts, change['diff'])
     
-    def _format_diff_preview(self, diff: str) -> List[str]:
-        """diff 미리보기 형식화"""
-        diff_lines = diff.split('\n')[:self.MAX_DIFF_LINES]
-        
-        # 중요한 변경사항만 표시
-        important_lines = []
-        for line in diff_lines:
-            if line.startswith(('+', '-')) and not line.startswith(('+++', '---')):
-                important_lines.append(line)
-                
-        if not important_lines:
-            important_lines = diff_lines[:5]
-        
-        preview_lines = ["```diff"]
-        preview_lines.extend(important_lines[:10])  # 최대 10줄
+    def _append_diff_preview(self, parts: List[str], diff: str) -> None:
+        """diff 미리보기를 parts에 추가"""
+        # 미리보기에 필요한 줄까지만 분할 (나머지는 하나의 꼬리 문자열로 남음)
+        diff_lines = diff.split('\n', self.MAX_DIFF_LINES)
+        truncated = len(diff_lines) > self.MAX_DIFF_LINES
+        del diff_lines[self.MAX_DIFF_LINES:]
+        
+        parts.append("```diff")
+        
+        # 중요한 변경사항만 표시 (최대 10줄), 없으면 앞부분 5줄
+        important_lines = (
+            line for line in diff_lines
+            if line.startswith(('+', '-')) and not line.startswith(('+++', '---'))
+        )
+        start = len(parts)
+        parts.extend(itertools.islice(important_lines, 10))
+        if len(parts) == start:
+            parts.extend(diff_lines[:5])
         
-        if len(diff.split('\n')) > self.MAX_DIFF_LINES:
-            preview_lines.append("...")
+        if truncated:
+            parts.append("...")
             
-        preview_lines.append("```")
-        return preview_lines 
\ No newline at end of file
+        parts.append("```") 
\ No newline at end of file
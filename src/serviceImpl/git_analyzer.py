@@ -1,11 +1,21 @@
 """Git 변경사항 분석 모듈"""
 
+import logging
 import os
+import re
+import stat
 from typing import List, Dict, Tuple, Optional, Iterator
 from git import Repo, diff
+from git.exc import GitCommandError
 from pathlib import Path
 from ..config.config import Config
 
+# 언어별 함수/클래스 시작 패턴 (청크 분할 지점 감지용)
+_UNIT_START_RE = re.compile('|'.join(map(re.escape, (
+    'def ', 'class ', 'function ', 'func ', 'const ', 'let ', 'var ',
+    'public ', 'private ', 'protected ', 'static '
+))))
+
 
 class GitAnalyzer:
     """Git 저장소 변경사항 분석 클래스"""
@@ -21,21 +31,52 @@ class GitAnalyzer:
         
         self.head_commit = self.repo.head.commit if self.repo.head.is_valid() else self.EMPTY_TREE_SHA
         self.ignore_patterns = Config.IGNORE_PATTERNS
+        self._ignore_re = Config.get_ignore_regex()
         self.max_file_size = Config.MAX_FILE_SIZE_MB * 1024 * 1024  # MB를 바이트로 변환
 
     def should_ignore_file(self, file_path: str) -> bool:
         """파일을 무시해야 하는지 확인"""
-        for pattern in self.ignore_patterns:
-            if pattern in file_path:
-                return True
+        if self._ignore_re.search(file_path):
+            return True
         
-        # 파일 크기 확인
-        full_path = self.repo_path / file_path
-        if full_path.exists() and full_path.is_file():
-            if full_path.stat().st_size > self.max_file_size:
-                return True
-                
-        return False
+        # 파일 크기 확인 (stat 한 번으로 존재 여부, 종류, 크기를 함께 확인)
+        file_stat = self._stat_regular_file(self.repo_path / file_path)
+        return file_stat is not None and file_stat.st_size > self.max_file_size
+
+    @staticmethod
+    def _stat_regular_file(full_path: Path) -> Optional[os.stat_result]:
+        """일반 파일이면 stat 결과, 없거나 일반 파일이 아니면 None 반환"""
+        try:
+            file_stat = full_path.stat()
+        except OSError:
+            return None
+        return file_stat if stat.S_ISREG(file_stat.st_mode) else None
+
+    def has_changes(self) -> bool:
+        """변경사항 존재 여부를 빠르게 확인 (get_all_changes 전 사전 검사용)
+        
+        `git diff --quiet`는 차이를 발견하는 즉시 종료하므로 변경사항이 없는
+        일반적인 경우에 diff 객체를 만들지 않고 바로 반환할 수 있습니다.
+        무시 패턴은 적용하지 않으므로 True여도 실제 분석 결과는 비어 있을 수 있습니다.
+        """
+        try:
+            self.repo.git.diff('--quiet')
+            self.repo.git.diff('--cached', '--quiet', self.head_commit)
+        except GitCommandError:
+            # --quiet는 차이가 있으면 종료 코드 1을 반환
+            return True
+        
+        untracked = self.repo.git.ls_files('--others', '--exclude-standard', '--directory', '--no-empty-directory')
+        return bool(untracked.strip())
+
+    def _list_untracked_files(self) -> List[str]:
+        """추적되지 않은 파일 목록 조회
+
+        repo.untracked_files는 `git status`를 실행해 이미 조회한 스테이징/작업 트리
+        diff를 다시 계산하므로, 추적되지 않은 파일만 나열하는 ls-files를 사용합니다.
+        """
+        output = self.repo.git.ls_files('--others', '--exclude-standard', '-z')
+        return [f for f in output.split('\0') if f]
 
     def get_all_changes(self) -> Dict[str, List[str]]:
         """모든 변경사항 가져오기 (스테이징 + 비스테이징)"""
@@ -71,27 +112,34 @@ class GitAnalyzer:
                 
             if d.change_type == 'D':
                 # Already staged for deletion, now removed from filesystem
-                if d.a_path not in all_changes['deleted']:
-                    all_changes['deleted'].add(d.a_path)
+                all_changes['deleted'].add(d.a_path)
             else: # A, M
                  # If a file was added and then modified, it is still 'added'
                 if d.a_path not in all_changes['added']:
                     all_changes['modified'].add(d.a_path)
         
         # Untracked files
-        for f in self.repo.untracked_files:
+        for f in self._list_untracked_files():
             if not self.should_ignore_file(f):
                 all_changes['untracked'].add(f)
             
         # Convert sets to lists
-        return {k: sorted(list(v)) for k, v in all_changes.items()}
+        return {k: sorted(v) for k, v in all_changes.items()}
         
-    def get_diff_chunks(self, max_chunk_size: int = None) -> List[Dict[str, str]]:
+    def get_diff_chunks(self, max_chunk_size: int = None,
+                        untracked: Optional[List[str]] = None) -> List[Dict[str, str]]:
         """변경사항을 의미있는 청크로 분할"""
+        return list(self.iter_diff_chunks(max_chunk_size, untracked))
+
+    def iter_diff_chunks(self, max_chunk_size: int = None,
+                         untracked: Optional[List[str]] = None) -> Iterator[Dict[str, str]]:
+        """변경사항을 청크 단위로 순차 생성 (전체 diff를 메모리에 모으지 않음)
+
+        untracked: get_all_changes()['untracked']처럼 이미 조회하고 필터링한 목록을 넘기면
+        추적되지 않은 파일을 다시 조회하지 않습니다.
+        """
         if max_chunk_size is None:
             max_chunk_size = Config.MAX_CHUNK_SIZE
-            
-        chunks = []
         
         # Staged diffs
         staged_diff = self.repo.index.diff(self.head_commit, create_patch=True)
@@ -99,7 +147,7 @@ class GitAnalyzer:
             if self.should_ignore_file(d.a_path or d.b_path):
                 continue
                 
-            chunks.extend(self._process_diff_item(d, max_chunk_size))
+            yield from self._process_diff_item(d, max_chunk_size)
 
         # Unstaged diffs
         unstaged_diff = self.repo.index.diff(None, create_patch=True)
@@ -107,16 +155,13 @@ class GitAnalyzer:
             if self.should_ignore_file(d.a_path or d.b_path):
                 continue
                 
-            chunks.extend(self._process_diff_item(d, max_chunk_size))
+            yield from self._process_diff_item(d, max_chunk_size)
 
         # Untracked files
-        for file_path in self.repo.untracked_files:
-            if self.should_ignore_file(file_path):
-                continue
-                
-            chunks.extend(self._process_untracked_file(file_path, max_chunk_size))
-
-        return chunks
+        if untracked is None:
+            untracked = [f for f in self._list_untracked_files() if not self.should_ignore_file(f)]
+        for file_path in untracked:
+            yield from self._process_untracked_file(file_path, max_chunk_size)
 
     def _process_diff_item(self, d: diff.Diff, max_chunk_size: int) -> List[Dict[str, str]]:
         """개별 diff 항목 처리"""
@@ -164,10 +209,11 @@ class GitAnalyzer:
             full_path = self.repo_path / file_path
             
             # 파일 존재 여부 및 크기 확인
-            if not full_path.exists() or not full_path.is_file():
+            file_stat = self._stat_regular_file(full_path)
+            if file_stat is None:
                 return []
                 
-            file_size = full_path.stat().st_size
+            file_size = file_stat.st_size
             if file_size > self.max_file_size:
                 return [{
                     'type': 'untracked',
@@ -196,7 +242,6 @@ class GitAnalyzer:
                 'diff': f"파일 읽기 오류: {type(e).__name__}"
             })
         except Exception as e:
-            import logging
             logging.error(f"Unexpected error processing {file_path}: {e}")
             chunks.append({
                 'type': 'untracked',
@@ -307,82 +352,78 @@ class GitAnalyzer:
 
     def _split_by_logical_units(self, lines: List[str], header_lines: List[str], 
                                 change_type: str, path: str, max_chunk_size: int) -> List[Dict[str, str]]:
-        """함수/클래스 등 논리적 단위로 분할"""
+        """함수/클래스 등 논리적 단위로 분할
+
+        청크마다 줄 리스트를 복사하지 않고 lines의 [시작, 끝) 인덱스만 추적하다가
+        청크를 내보낼 때 한 번만 문자열로 합칩니다.
+        """
         chunks = []
-        current_chunk_lines = header_lines.copy()
-        current_size = sum(len(line) + 1 for line in current_chunk_lines)
-        
-        # 언어별 함수/클래스 시작 패턴
-        function_patterns = [
-            'def ', 'class ', 'function ', 'func ', 'const ', 'let ', 'var ',
-            'public ', 'private ', 'protected ', 'static '
-        ]
+        header_text = '\n'.join(header_lines)
+        header_size = sum(len(line) + 1 for line in header_lines)
+        min_size = len(header_text) + 100  # 최소 크기
+        chunk_start = 0
+        current_size = header_size
         
         for i, line in enumerate(lines):
-            # 함수/클래스 시작 감지
-            is_new_unit = any(pattern in line for pattern in function_patterns)
             line_size = len(line) + 1
             
-            if is_new_unit and current_size > len('\n'.join(header_lines)) + 100:  # 최소 크기
+            # 함수/클래스 시작 감지
+            if current_size > min_size and _UNIT_START_RE.search(line):
                 if current_size + line_size > max_chunk_size:
                     # 현재 청크 저장
-                    chunks.append({
-                        'type': change_type,
-                        'path': path,
-                        'diff': '\n'.join(current_chunk_lines)
-                    })
-                    current_chunk_lines = header_lines.copy()
-                    current_size = sum(len(line) + 1 for line in current_chunk_lines)
+                    chunks.append(self._make_chunk(change_type, path, header_text, lines, chunk_start, i))
+                    chunk_start = i
+                    current_size = header_size
             
-            current_chunk_lines.append(line)
             current_size += line_size
             
             # 크기 초과시 강제 분할
             if current_size > max_chunk_size:
-                chunks.append({
-                    'type': change_type,
-                    'path': path,
-                    'diff': '\n'.join(current_chunk_lines)
-                })
-                current_chunk_lines = header_lines.copy()
-                current_size = sum(len(line) + 1 for line in current_chunk_lines)
+                chunks.append(self._make_chunk(change_type, path, header_text, lines, chunk_start, i + 1))
+                chunk_start = i + 1
+                current_size = header_size
         
         # 마지막 청크
-        if len(current_chunk_lines) > len(header_lines):
-            chunks.append({
-                'type': change_type,
-                'path': path,
-                'diff': '\n'.join(current_chunk_lines)
-            })
+        if chunk_start < len(lines):
+            chunks.append(self._make_chunk(change_type, path, header_text, lines, chunk_start, len(lines)))
             
         return chunks
 
     def _split_by_size(self, chunks: list, header_lines: List[str], content_lines: List[str],
                       change_type: str, path: str, max_chunk_size: int):
         """크기 기준으로 분할"""
-        current_chunk_lines = header_lines.copy()
-        current_size = sum(len(line) + 1 for line in current_chunk_lines)
+        header_text = '\n'.join(header_lines)
+        header_size = sum(len(line) + 1 for line in header_lines)
+        chunk_start = 0
+        current_size = header_size
         
-        for line in content_lines:
+        for i, line in enumerate(content_lines):
             line_size = len(line) + 1
-            if current_size + line_size > max_chunk_size and len(current_chunk_lines) > len(header_lines):
-                chunks.append({
-                    'type': change_type,
-                    'path': path,
-                    'diff': '\n'.join(current_chunk_lines)
-                })
-                current_chunk_lines = header_lines.copy()
-                current_size = sum(len(line) + 1 for line in current_chunk_lines)
+            if current_size + line_size > max_chunk_size and i > chunk_start:
+                chunks.append(self._make_chunk(change_type, path, header_text, content_lines, chunk_start, i))
+                chunk_start = i
+                current_size = header_size
             
-            current_chunk_lines.append(line)
             current_size += line_size
 
-        if len(current_chunk_lines) > len(header_lines):
-            chunks.append({
-                'type': change_type,
-                'path': path,
-                'diff': '\n'.join(current_chunk_lines)
-            })
+        if chunk_start < len(content_lines):
+            chunks.append(self._make_chunk(change_type, path, header_text, content_lines,
+                                           chunk_start, len(content_lines)))
+
+    @staticmethod
+    def _make_chunk(change_type: str, path: str, header_text: str, lines: List[str],
+                    start: int, end: int) -> Dict[str, str]:
+        """헤더와 lines[start:end]를 합쳐 청크 생성"""
+        body = '\n'.join(lines[start:end])
+        if header_text and end > start:
+            diff_text = f"{header_text}\n{body}"
+        else:
+            diff_text = header_text or body
+        return {
+            'type': change_type,
+            'path': path,
+            'diff': diff_text
+        }
 
     def _get_change_type(self, d: diff.Diff) -> str:
         if d.new_file: return 'added'
@@ -1,23 +1,37 @@
 """LLM 프로바이더 추상화 - Ollama, OpenRouter, Gemini 지원"""
 
 import os
+import asyncio
+import importlib.util
 import json
 import time
 import signal
 import threading
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Iterator, Tuple
 import requests
+from requests.adapters import HTTPAdapter
     
+# google-generativeai는 임포트 비용(gRPC/protobuf)이 크므로 설치 여부만 확인하고
+# 실제 모듈은 GeminiProvider를 생성할 때 로드
 try:
-    import google.generativeai as genai
-    GEMINI_AVAILABLE = True
+    GEMINI_AVAILABLE = importlib.util.find_spec("google.generativeai") is not None
 except ImportError:
     GEMINI_AVAILABLE = False
-    
-from dotenv import load_dotenv
+genai = None
+
+
+def _load_genai():
+    """google.generativeai 모듈을 처음 필요할 때 한 번만 임포트"""
+    global genai
+    if genai is None:
+        import google.generativeai
+        genai = google.generativeai
+    return genai
+
 
-load_dotenv()
+# .env는 config 모듈 임포트 시 한 번만 로드됨
+from ..config.config import Config
 
 
 class TimeoutError(Exception):
@@ -67,9 +81,32 @@ class RetryableLLMError(LLMProviderError):
 class LLMProvider(ABC):
     """LLM 프로바이더 기본 클래스"""
     
+    # 동시에 보낼 수 있는 기본 요청 수 (API 프로바이더 기준)
+    max_concurrency = 4
+    
     def __init__(self, max_retries: int = 3, retry_delay: float = 1.0):
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.session = self._create_session()
+    
+    def _create_session(self) -> requests.Session:
+        """요청 간 TCP/TLS 연결을 재사용하는 세션 생성 (동시 요청 수만큼 연결 유지)"""
+        pool_size = max(self.max_concurrency, Config.MAX_CONCURRENT_LLM_CALLS, 1)
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+    
+    def close(self):
+        """HTTP 세션 종료"""
+        self.session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
     
     @abstractmethod
     def _generate_impl(self, prompt: str, system_prompt: Optional[str] = None) -> str:
@@ -97,11 +134,71 @@ class LLMProvider(ABC):
                 raise LLMProviderError(f"예상치 못한 오류: {e}") from e
         
         raise last_error or LLMProviderError("최대 재시도 횟수 초과")
+    
+    async def agenerate(self, prompt: str, system_prompt: Optional[str] = None) -> str:
+        """generate의 비동기 버전 (블로킹 HTTP 호출을 스레드에서 실행)"""
+        return await asyncio.to_thread(self.generate, prompt, system_prompt)
+    
+    def _generate_stream_impl(self, prompt: str, system_prompt: Optional[str] = None) -> Iterator[str]:
+        """스트리밍 응답 생성 구현 (기본: 전체 응답을 한 번에 반환)"""
+        yield self._generate_impl(prompt, system_prompt)
+    
+    def generate_stream(self, prompt: str, system_prompt: Optional[str] = None) -> Iterator[str]:
+        """프롬프트에 대한 응답을 조각 단위로 생성 (스트리밍, 첫 조각 전까지 재시도)
+
+        첫 조각을 넘긴 뒤에는 이미 출력된 내용과 섞이므로 재시도하지 않고 오류를 그대로 전달합니다.
+        """
+        last_error = None
+        
+        for attempt in range(self.max_retries):
+            started = False
+            try:
+                for piece in self._generate_stream_impl(prompt, system_prompt):
+                    started = True
+                    yield piece
+                return
+            except RetryableLLMError as e:
+                if started:
+                    raise
+                last_error = e
+                if attempt < self.max_retries - 1:
+                    time.sleep(self.retry_delay * (attempt + 1))
+                continue
+            except LLMProviderError:
+                raise
+            except Exception as e:
+                raise LLMProviderError(f"예상치 못한 오류: {e}") from e
+        
+        raise last_error or LLMProviderError("최대 재시도 횟수 초과")
 
 
 class OllamaProvider(LLMProvider):
     """Ollama 로컬 모델 프로바이더 (requests API 사용)"""
     
+    # 로컬 모델은 CPU/GPU 자원을 공유하므로 순차 처리
+    max_concurrency = 1
+    
+    # 설치된 모델 목록 캐시 (조회 시각, 모델 목록)
+    MODELS_CACHE_TTL_SECONDS = 5.0
+    
+    # 선호 모델 순서 (코드 분석에 적합한 모델들)
+    PREFERRED_MODELS = (
+        'gemma3:1b',
+        'qwen2.5-coder:1.5b',
+        'qwen2.5-coder:3b',
+        'llama3.2:1b',
+        'llama3.2:3b',
+        'codellama:7b',
+        'codellama',
+        'llama3.1:8b',
+        'llama2:7b',
+        'llama2',
+        'mistral',
+        'phi3',
+        'qwen2.5-coder:7b'
+    )
+    _models_cache: Tuple[float, Optional[List[Dict[str, Any]]]] = (0.0, None)
+    
     def __init__(self, model_name: str = "gemma3:1b", max_retries: int = 3):
         super().__init__(max_retries=max_retries)
         self.model_name = model_name
@@ -109,7 +206,7 @@ class OllamaProvider(LLMProvider):
         
         # Ollama 서버 연결 확인
         try:
-            response = requests.get(f"{self.base_url}/api/tags", timeout=2)
+            response = self.session.get(f"{self.base_url}/api/tags", timeout=2)
             if response.status_code != 200:
                 raise LLMProviderError("Ollama 서버에 연결할 수 없습니다. Ollama가 실행 중인지 확인하세요.")
         except requests.ConnectionError:
@@ -125,18 +222,18 @@ class OllamaProvider(LLMProvider):
             messages.append({"role": "user", "content": prompt})
             
             # Ollama API 직접 호출
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/api/chat",
                 json={
                     'model': self.model_name,
                     'messages': messages,
                     'stream': False,
                     'options': {
-                        'temperature': 0.7,
-                        'num_predict': 500,
+                        'temperature': Config.LLM_TEMPERATURE,
+                        'num_predict': Config.LLM_MAX_TOKENS,
                     }
                 },
-                timeout=30
+                timeout=Config.LLM_TIMEOUT_SECONDS
             )
             
             if response.status_code != 200:
@@ -157,48 +254,81 @@ class OllamaProvider(LLMProvider):
                 raise RetryableLLMError(f"Ollama 연결 오류: {e}") from e
             raise LLMProviderError(f"Ollama 오류: {e}") from e
     
-    @staticmethod
-    def get_available_models() -> List[Dict[str, Any]]:
-        """설치된 Ollama 모델 목록 가져오기"""
+    def _generate_stream_impl(self, prompt: str, system_prompt: Optional[str] = None) -> Iterator[str]:
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": prompt})
+        
+        try:
+            with self.session.post(
+                f"{self.base_url}/api/chat",
+                json={
+                    'model': self.model_name,
+                    'messages': messages,
+                    'stream': True,
+                    'options': {
+                        'temperature': Config.LLM_TEMPERATURE,
+                        'num_predict': Config.LLM_MAX_TOKENS,
+                    }
+                },
+                timeout=Config.LLM_TIMEOUT_SECONDS,
+                stream=True
+            ) as response:
+                if response.status_code != 200:
+                    raise RetryableLLMError(f"Ollama API 오류: {response.status_code}")
+                
+                # 응답은 줄 단위 JSON 객체로 전달됨
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    data = json.loads(line)
+                    content = data.get('message', {}).get('content')
+                    if content:
+                        yield content
+                    if data.get('done'):
+                        break
+        except requests.ConnectionError:
+            raise RetryableLLMError("Ollama 서버에 연결할 수 없습니다.")
+        except requests.Timeout:
+            raise RetryableLLMError("Ollama 요청 타임아웃")
+        except ValueError as e:
+            raise LLMProviderError(f"Ollama 스트리밍 응답 처리 오류: {e}") from e
+    
+    @classmethod
+    def get_available_models(cls) -> List[Dict[str, Any]]:
+        """설치된 Ollama 모델 목록 가져오기 (짧은 TTL 동안 결과 재사용)"""
+        cached_at, cached_models = cls._models_cache
+        if cached_models is not None and time.monotonic() - cached_at < cls.MODELS_CACHE_TTL_SECONDS:
+            return cached_models
+        
         try:
             response = requests.get('http://localhost:11434/api/tags', timeout=5)
             if response.status_code == 200:
                 data = response.json()
-                return data.get('models', [])
-            return []
+                models = data.get('models', [])
+            else:
+                models = []
         except Exception:
-            return []
+            models = []
+        
+        cls._models_cache = (time.monotonic(), models)
+        return models
     
     @staticmethod
-    def suggest_model() -> Optional[str]:
-        """사용 가능한 모델 중 적합한 모델 추천"""
-        models = OllamaProvider.get_available_models()
+    def suggest_model(models: Optional[List[Dict[str, Any]]] = None) -> Optional[str]:
+        """사용 가능한 모델 중 적합한 모델 추천 (이미 조회한 모델 목록 전달 가능)"""
+        if models is None:
+            models = OllamaProvider.get_available_models()
         if not models:
             return None
             
         model_names = [m['name'] for m in models]
         
-        # 선호 모델 순서 (코드 분석에 적합한 모델들)
-        preferred_models = [
-            'gemma3:1b',
-            'qwen2.5-coder:1.5b',
-            'qwen2.5-coder:3b',
-            'llama3.2:1b',
-            'llama3.2:3b',
-            'codellama:7b',
-            'codellama',
-            'llama3.1:8b',
-            'llama2:7b',
-            'llama2',
-            'mistral',
-            'phi3',
-            'qwen2.5-coder:7b'
-        ]
-        
-        # 선호 모델 중 사용 가능한 첫 번째 모델 반환
-        for preferred in preferred_models:
+        # 선호 모델 중 사용 가능한 첫 번째 모델 반환 (startswith는 부분 문자열 검사에 포함됨)
+        for preferred in OllamaProvider.PREFERRED_MODELS:
             for model_name in model_names:
-                if preferred in model_name or model_name.startswith(preferred):
+                if preferred in model_name:
                     return model_name
                     
         # 선호 모델이 없으면 첫 번째 모델 반환
@@ -208,9 +338,11 @@ class OllamaProvider(LLMProvider):
 class OpenRouterProvider(LLMProvider):
     """OpenRouter API 프로바이더"""
     
+    # cache_control 기반 프롬프트 캐싱을 지원하는 모델
+    PROMPT_CACHE_MODEL_PREFIXES = ("anthropic/", "google/")
+    
     def __init__(self, model_name: str = "openai/gpt-3.5-turbo", max_retries: int = 3):
         super().__init__(max_retries=max_retries)
-        from .config import Config
         self.api_key = Config.OPENROUTER_API_KEY
         if not self.api_key:
             raise LLMProviderError(
@@ -219,8 +351,15 @@ class OpenRouterProvider(LLMProvider):
             )
         self.model_name = model_name
         self.base_url = "https://openrouter.ai/api/v1/chat/completions"
+        # 요청마다 같은 헤더를 다시 만들지 않도록 세션에 한 번만 설정
+        self.session.headers.update({
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+            "User-Agent": "GitCommitManager/1.0"
+        })
         
-    def _generate_impl(self, prompt: str, system_prompt: Optional[str] = None) -> str:
+    def _build_request(self, prompt: str, system_prompt: Optional[str], stream: bool = False) -> Dict[str, Any]:
+        """요청 본문 구성"""
         # 입력 검증
         if not prompt or not isinstance(prompt, str):
             raise LLMProviderError("유효하지 않은 프롬프트")
@@ -229,42 +368,59 @@ class OpenRouterProvider(LLMProvider):
         max_prompt_length = 50000  # 약 50KB
         if len(prompt) > max_prompt_length:
             raise LLMProviderError(f"프롬프트가 너무 깁니다 ({len(prompt)} > {max_prompt_length})")
-            
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-            "User-Agent": "GitCommitManager/1.0"
-        }
         
         messages = []
         if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
+            messages.append({"role": "system", "content": self._build_system_content(system_prompt)})
         messages.append({"role": "user", "content": prompt})
         
         data = {
             "model": self.model_name,
             "messages": messages,
-            "max_tokens": 500,
-            "temperature": 0.7
+            "max_tokens": Config.LLM_MAX_TOKENS,
+            "temperature": Config.LLM_TEMPERATURE
         }
+        if stream:
+            data["stream"] = True
+            
+        return data
+    
+    def _build_system_content(self, system_prompt: str) -> Any:
+        """시스템 프롬프트 구성 (지원 모델은 프롬프트 캐시 지점 표시)
+        
+        OpenAI 계열은 동일한 프리픽스를 자동으로 캐싱하지만, Anthropic/Gemini 계열은
+        cache_control 표시가 있어야 고정 프리픽스를 재사용합니다.
+        """
+        if self.model_name.startswith(self.PROMPT_CACHE_MODEL_PREFIXES):
+            return [{
+                "type": "text",
+                "text": system_prompt,
+                "cache_control": {"type": "ephemeral"}
+            }]
+        return system_prompt
+    
+    def _check_status(self, response: requests.Response):
+        """재시도 가능한 HTTP 상태 코드 확인"""
+        if response.status_code == 429:
+            raise RetryableLLMError("API 속도 제한에 도달했습니다")
+        elif response.status_code >= 500:
+            raise RetryableLLMError(f"서버 오류: {response.status_code}")
+        response.raise_for_status()
+        
+    def _generate_impl(self, prompt: str, system_prompt: Optional[str] = None) -> str:
+        data = self._build_request(prompt, system_prompt)
         
         try:
-            response = requests.post(
+            response = self.session.post(
                 self.base_url, 
-                headers=headers, 
                 json=data,
-                timeout=30,
+                timeout=Config.LLM_TIMEOUT_SECONDS,
                 # 보안 옵션
                 verify=True,  # SSL 인증서 검증
                 allow_redirects=False  # 리다이렉트 방지
             )
             
-            if response.status_code == 429:
-                raise RetryableLLMError("API 속도 제한에 도달했습니다")
-            elif response.status_code >= 500:
-                raise RetryableLLMError(f"서버 오류: {response.status_code}")
-                
-            response.raise_for_status()
+            self._check_status(response)
             result = response.json()
             
             if 'choices' not in result or not result['choices']:
@@ -279,17 +435,56 @@ class OpenRouterProvider(LLMProvider):
             raise LLMProviderError(f"OpenRouter API 요청 오류: {e}") from e
         except (KeyError, IndexError) as e:
             raise LLMProviderError(f"OpenRouter API 응답 처리 오류: {e}") from e
+    
+    def _generate_stream_impl(self, prompt: str, system_prompt: Optional[str] = None) -> Iterator[str]:
+        data = self._build_request(prompt, system_prompt, stream=True)
+        
+        try:
+            with self.session.post(
+                self.base_url,
+                json=data,
+                timeout=Config.LLM_TIMEOUT_SECONDS,
+                verify=True,
+                allow_redirects=False,
+                stream=True
+            ) as response:
+                self._check_status(response)
+                response.encoding = 'utf-8'
+                
+                # SSE 형식: "data: {...}" 줄 단위, "data: [DONE]"으로 종료
+                for line in response.iter_lines(decode_unicode=True):
+                    if not line or not line.startswith("data:"):
+                        continue
+                    payload = line[len("data:"):].strip()
+                    if payload == "[DONE]":
+                        break
+                    event = json.loads(payload)
+                    choices = event.get('choices') or []
+                    if not choices:
+                        continue
+                    content = choices[0].get('delta', {}).get('content')
+                    if content:
+                        yield content
+        except requests.Timeout:
+            raise RetryableLLMError("API 요청 타임아웃")
+        except requests.ConnectionError:
+            raise RetryableLLMError("API 연결 오류")
+        except requests.RequestException as e:
+            raise LLMProviderError(f"OpenRouter API 요청 오류: {e}") from e
+        except ValueError as e:
+            raise LLMProviderError(f"OpenRouter API 응답 처리 오류: {e}") from e
 
 
 class GeminiProvider(LLMProvider):
     """Google Gemini API 프로바이더"""
     
+    MAX_PROMPT_LENGTH = 30000
+    
     def __init__(self, model_name: str = "gemini-pro", max_retries: int = 3):
         super().__init__(max_retries=max_retries)
         if not GEMINI_AVAILABLE:
             raise LLMProviderError("google-generativeai 패키지가 설치되지 않았습니다. pip install google-generativeai를 실행하세요.")
             
-        from .config import Config
         self.api_key = Config.GEMINI_API_KEY
         if not self.api_key:
             raise LLMProviderError(
@@ -298,33 +493,37 @@ class GeminiProvider(LLMProvider):
             )
 
         try:
+            _load_genai()
             genai.configure(api_key=self.api_key)
             self.model = genai.GenerativeModel(
                 model_name,
                 generation_config={
-                    "temperature": 0.7,
-                    "max_output_tokens": 500,
+                    "temperature": Config.LLM_TEMPERATURE,
+                    "max_output_tokens": Config.LLM_MAX_TOKENS,
                 }
             )
         except Exception as e:
             raise LLMProviderError(f"Gemini SDK 초기화 오류: {e}") from e
 
+    def _build_prompt(self, prompt: str, system_prompt: Optional[str]) -> str:
+        """입력 검증 후 시스템 프롬프트를 앞에 붙인 최종 프롬프트 생성
+        
+        google-generativeai 0.3 계열에는 system_instruction이 없어 프롬프트에 직접 포함합니다.
+        """
+        if not prompt or not isinstance(prompt, str):
+            raise LLMProviderError("유효하지 않은 프롬프트")
+        
+        # 프롬프트 길이 제한 (Gemini의 상대적으로 작은 컨텍스트 창)
+        if len(prompt) > self.MAX_PROMPT_LENGTH:
+            raise LLMProviderError(f"프롬프트가 너무 깁니다 ({len(prompt)} > {self.MAX_PROMPT_LENGTH})")
+        
+        if system_prompt:
+            return f"{system_prompt}\n\n{prompt}"
+        return prompt
+
     def _generate_impl(self, prompt: str, system_prompt: Optional[str] = None) -> str:
         try:
-            # 입력 검증
-            if not prompt or not isinstance(prompt, str):
-                raise LLMProviderError("유효하지 않은 프롬프트")
-                
-            # 프롬프트 길이 제한
-            max_prompt_length = 30000  # Gemini의 상대적으로 작은 컨텍스트 창
-            if len(prompt) > max_prompt_length:
-                raise LLMProviderError(f"프롬프트가 너무 깁니다 ({len(prompt)} > {max_prompt_length})")
-            
-            full_prompt = prompt
-            if system_prompt:
-                full_prompt = f"{system_prompt}\n\n{prompt}"
-                
-            response = self.model.generate_content(full_prompt)
+            response = self.model.generate_content(self._build_prompt(prompt, system_prompt))
             
             if not response or not response.text:
                 raise RetryableLLMError("응답이 비어있습니다")
@@ -333,10 +532,23 @@ class GeminiProvider(LLMProvider):
         except Exception as e:
             if "quota" in str(e).lower():
                 raise RetryableLLMError("API 할당량 초과")
-            if GEMINI_AVAILABLE and hasattr(genai, 'types') and hasattr(genai.types, 'BlockedPromptException'):
+            if genai is not None and hasattr(genai, 'types') and hasattr(genai.types, 'BlockedPromptException'):
                 if isinstance(e, genai.types.BlockedPromptException):
                     raise LLMProviderError("프롬프트가 차단되었습니다")
             raise LLMProviderError(f"Gemini API 오류: {e}") from e
+    
+    def _generate_stream_impl(self, prompt: str, system_prompt: Optional[str] = None) -> Iterator[str]:
+        full_prompt = self._build_prompt(prompt, system_prompt)
+        
+        try:
+            for chunk in self.model.generate_content(full_prompt, stream=True):
+                text = getattr(chunk, 'text', None)
+                if text:
+                    yield text
+        except Exception as e:
+            if "quota" in str(e).lower():
+                raise RetryableLLMError("API 할당량 초과")
+            raise LLMProviderError(f"Gemini API 오류: {e}") from e
 
 
 def get_provider(provider_type: str, model_name: Optional[str] = None) -> LLMProvider:
@@ -0,0 +1,124 @@
+"""임베딩 유사도 기반 커밋 메시지 시맨틱 캐시 모듈"""
+
+import logging
+import math
+import os
+import tempfile
+import time
+from typing import List, Optional, Tuple
+import requests
+from ..config.config import Config
+from ..utils import serialization
+
+
+class SemanticCache:
+    """유사한 diff에 대해 이전 커밋 메시지를 재사용하는 캐시
+
+    정확히 같은 diff만 잡아내는 해시 캐시와 달리, 공백 차이나 헝크 순서가
+    조금 다른 "거의 같은" 변경사항도 임베딩 코사인 유사도로 찾아냅니다.
+    임베딩은 Ollama의 로컬 임베딩 API를 사용합니다.
+    """
+
+    CACHE_FILE_NAME = "semantic_cache.json"
+    MAX_ENTRIES = 200  # 선형 탐색 비용 제한
+    MAX_EMBED_CHARS = 8000  # 임베딩 입력 길이 제한
+
+    def __init__(self, namespace: str = ""):
+        self.enabled = Config.ENABLE_CACHE and Config.ENABLE_SEMANTIC_CACHE
+        self.threshold = Config.SEMANTIC_CACHE_THRESHOLD
+        self.ttl = Config.CACHE_TTL_SECONDS
+        self.embedding_model = Config.SEMANTIC_CACHE_MODEL
+        self.base_url = "http://localhost:11434"
+        self.namespace = namespace
+        self.cache_file = Config.get_cache_dir() / self.CACHE_FILE_NAME
+
+    def _embed(self, text: str) -> Optional[List[float]]:
+        """Ollama 임베딩 API로 텍스트 임베딩 생성 (실패 시 None)"""
+        try:
+            response = requests.post(
+                f"{self.base_url}/api/embeddings",
+                json={'model': self.embedding_model, 'prompt': text[:self.MAX_EMBED_CHARS]},
+                timeout=10
+            )
+            if response.status_code != 200:
+                logging.debug(f"임베딩 API 오류: {response.status_code}")
+                return None
+            embedding = response.json().get('embedding')
+            return embedding or None
+        except Exception as e:
+            logging.debug(f"임베딩 생성 실패: {e}")
+            return None
+
+    @staticmethod
+    def _cosine_similarity(a: List[float], b: List[float], b_norm: float) -> float:
+        """코사인 유사도 계산 (b의 노름은 미리 계산해서 전달)"""
+        if len(a) != len(b):
+            return 0.0
+        a_norm = math.sqrt(sum(x * x for x in a))
+        if a_norm == 0 or b_norm == 0:
+            return 0.0
+        return sum(x * y for x, y in zip(a, b)) / (a_norm * b_norm)
+
+    def _load_entries(self) -> List[dict]:
+        """저장된 항목 중 만료되지 않은 항목만 로드"""
+        try:
+            with open(self.cache_file, 'rb') as f:
+                entries = serialization.loads(f.read())
+        except (OSError, ValueError):
+            return []
+
+        now = time.time()
+        return [e for e in entries if now - e.get('timestamp', 0) <= self.ttl]
+
+    def _save_entries(self, entries: List[dict]):
+        """항목을 원자적으로 저장"""
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_file.parent, suffix=".tmp")
+            with os.fdopen(fd, 'wb') as f:
+                f.write(serialization.dumps(entries[-self.MAX_ENTRIES:]))
+            os.replace(tmp_path, self.cache_file)
+        except Exception:
+            # 캐시 저장 실패는 무시
+            if tmp_path and os.path.exists(tmp_path):
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+
+    def lookup(self, content: str) -> Tuple[Optional[str], Optional[List[float]]]:
+        """유사한 항목이 있으면 (값, 임베딩) 반환, 없으면 (None, 임베딩) 반환"""
+        if not self.enabled or not content:
+            return None, None
+
+        query = self._embed(content)
+        if query is None:
+            return None, None
+
+        query_norm = math.sqrt(sum(x * x for x in query))
+        best_value, best_score = None, 0.0
+        for entry in self._load_entries():
+            if entry.get('namespace') != self.namespace:
+                continue
+            score = self._cosine_similarity(entry['embedding'], query, query_norm)
+            if score > best_score:
+                best_value, best_score = entry['value'], score
+
+        if best_value is not None and best_score >= self.threshold:
+            logging.debug(f"시맨틱 캐시 히트 (유사도: {best_score:.3f})")
+            return best_value, query
+        return None, query
+
+    def add(self, embedding: Optional[List[float]], value: str):
+        """임베딩과 값을 캐시에 추가"""
+        if not self.enabled or embedding is None or not value:
+            return
+
+        entries = self._load_entries()
+        entries.append({
+            'namespace': self.namespace,
+            'embedding': embedding,
+            'value': value,
+            'timestamp': time.time()
+        })
+        self._save_entries(entries)
@@ -0,0 +1,96 @@
+"""CacheManager (SQLite + 메모리 LRU) 테스트"""
+
+import pytest
+
+from src.config.config import Config
+from src.serviceImpl import commit_analyzer
+from src.serviceImpl.commit_analyzer import CacheManager
+
+
+@pytest.fixture(autouse=True)
+def cache_config(tmp_path, monkeypatch):
+    """테스트마다 빈 캐시 디렉토리 사용"""
+    monkeypatch.setattr(Config, "CACHE_DIR", tmp_path / "cache")
+    monkeypatch.setattr(Config, "ENABLE_CACHE", True)
+    monkeypatch.setattr(Config, "CACHE_TTL_SECONDS", 300)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """CacheManager가 사용하는 time.time을 직접 조정할 수 있는 시계"""
+    now = [1_000_000.0]
+    monkeypatch.setattr(commit_analyzer.time, "time", lambda: now[0])
+    return now
+
+
+def test_set_and_get_round_trip():
+    cache = CacheManager("ollama:a")
+    cache.set("commit", "diff", "feat: x")
+    assert cache.get("commit", "diff") == "feat: x"
+    assert cache.get("commit", "other diff") is None
+    assert cache.get("review", "diff") is None
+
+
+def test_values_persist_across_instances():
+    CacheManager("ollama:a").set("commit", b"diff", "feat: x")
+    assert CacheManager("ollama:a").get("commit", b"diff") == "feat: x"
+
+
+def test_keys_are_separated_by_namespace_and_stable():
+    first, second = CacheManager("ollama:a"), CacheManager("ollama:b")
+    assert first._get_cache_key("commit", "diff") != second._get_cache_key("commit", "diff")
+    # str과 UTF-8 bytes는 같은 키
+    assert first._get_cache_key("commit", "변경") == first._get_cache_key("commit", "변경".encode("utf-8"))
+    assert first._get_cache_key("commit", "diff").startswith("commit_")
+
+    first.set("commit", "diff", "feat: a")
+    assert second.get("commit", "diff") is None
+
+
+def test_expired_entries_are_not_returned(clock):
+    cache = CacheManager()
+    cache.set("commit", "diff", "feat: x")
+    clock[0] += Config.CACHE_TTL_SECONDS + 1
+    assert cache.get("commit", "diff") is None
+    # 메모리 캐시를 거치지 않는 새 인스턴스에서도 만료
+    assert CacheManager().get("commit", "diff") is None
+
+
+def test_prune_expired_deletes_only_old_entries(clock):
+    cache = CacheManager()
+    cache.set("commit", "old", "feat: old")
+    clock[0] += Config.CACHE_TTL_SECONDS + 1
+    cache.set("commit", "new", "feat: new")
+    assert cache.prune_expired() == 1
+    assert cache.count() == 1
+    assert cache.get("commit", "new") == "feat: new"
+
+
+def test_memory_cache_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(CacheManager, "MEMORY_CACHE_SIZE", 2)
+    cache = CacheManager()
+    cache.set("commit", "a", "A")
+    cache.set("commit", "b", "B")
+    cache.get("commit", "a")  # a를 최근 사용으로 갱신
+    cache.set("commit", "c", "C")
+
+    remembered = set(cache._memory)
+    assert cache._get_cache_key("commit", "b") not in remembered
+    assert {cache._get_cache_key("commit", "a"), cache._get_cache_key("commit", "c")} == remembered
+    # 메모리에서 밀려난 항목은 DB에서 다시 읽음
+    assert cache.get("commit", "b") == "B"
+
+
+def test_clear_removes_all_entries():
+    cache = CacheManager()
+    cache.set("commit", "diff", "feat: x")
+    cache.clear()
+    assert cache.count() == 0
+    assert cache.get("commit", "diff") is None
+
+
+def test_disabled_cache_stores_nothing(monkeypatch):
+    monkeypatch.setattr(Config, "ENABLE_CACHE", False)
+    cache = CacheManager()
+    cache.set("commit", "diff", "feat: x")
+    assert cache.get("commit", "diff") is None
@@ -0,0 +1,139 @@
+"""CommitAnalyzer 캐시 키 및 리뷰 처리 테스트"""
+
+import asyncio
+import subprocess
+
+import pytest
+
+from src.config.config import Config
+from src.serviceImpl.commit_analyzer import CommitAnalyzer
+from src.serviceImpl.git_analyzer import GitAnalyzer
+from src.serviceImpl.llm_providers import LLMProvider, LLMProviderError
+
+
+class FakeLLM(LLMProvider):
+    """정해진 응답을 순서대로 반환하고 호출 횟수를 기록하는 프로바이더 (마지막 응답은 반복)"""
+
+    model_name = "fake"
+
+    def __init__(self, *responses: str):
+        super().__init__(max_retries=1, retry_delay=0)
+        self.responses = list(responses) or ["feat: x"]
+        self.calls = 0
+
+    def _generate_impl(self, prompt, system_prompt=None):
+        self.calls += 1
+        return self.responses[min(self.calls, len(self.responses)) - 1]
+
+
+@pytest.fixture
+def analyzer(tmp_path, monkeypatch):
+    """임시 저장소와 임시 캐시 디렉토리를 사용하는 CommitAnalyzer"""
+    monkeypatch.setattr(Config, "CACHE_DIR", tmp_path / "cache")
+    monkeypatch.setattr(Config, "ENABLE_CACHE", True)
+    monkeypatch.setattr(Config, "ENABLE_STRUCTURAL_CACHE", True)
+    monkeypatch.setattr(Config, "ENABLE_SEMANTIC_CACHE", False)
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    subprocess.run(["git", "init", "-q"], cwd=repo, check=True)
+    return CommitAnalyzer(FakeLLM(), GitAnalyzer(str(repo)))
+
+
+def _chunk(path: str, *lines: str) -> dict:
+    return {'type': 'modified', 'path': path, 'diff': '@@ -1,2 +1,2 @@\n' + '\n'.join(lines)}
+
+
+def test_structural_key_ignores_whitespace_and_comments(analyzer):
+    base = analyzer._get_structural_fingerprint(_chunk("a.js", "-let a = 1;", "+let a = 2;"))
+    spaced = analyzer._get_structural_fingerprint(_chunk("a.js", "-let  a = 1;", "+let a  =  2;", "+// 설명"))
+    assert base is not None
+    assert base == spaced
+
+
+def test_structural_key_is_none_for_comment_only_change(analyzer):
+    assert analyzer._get_structural_fingerprint(_chunk("a.py", "-# old", "+# new")) is None
+
+
+def test_structural_key_treats_c_preprocessor_lines_as_code(analyzer):
+    """C/C++의 #define 값 변경은 주석 변경이 아님"""
+    one = analyzer._get_structural_fingerprint(_chunk("a.c", "-#define SIZE 1", "+#define SIZE 2"))
+    two = analyzer._get_structural_fingerprint(_chunk("a.c", "-#define SIZE 1", "+#define SIZE 3"))
+    assert one is not None and two is not None
+    assert one != two
+
+
+def test_structural_key_keeps_python_indentation(analyzer):
+    """Python은 들여쓰기가 블록을 결정하므로 들여쓰기만 다른 변경도 다른 키"""
+    inside = analyzer._get_structural_fingerprint(_chunk("a.py", "     if x:", "+        run()"))
+    outside = analyzer._get_structural_fingerprint(_chunk("a.py", "     if x:", "+    run()"))
+    assert inside != outside
+
+
+def test_structural_key_ignores_indentation_for_other_languages(analyzer):
+    nested = analyzer._get_structural_fingerprint(_chunk("a.go", "+        run()"))
+    flat = analyzer._get_structural_fingerprint(_chunk("a.go", "+\trun()"))
+    assert nested == flat
+
+
+class FailingLLM(FakeLLM):
+    """항상 프로바이더 오류를 발생시키는 프로바이더"""
+
+    def _generate_impl(self, prompt, system_prompt=None):
+        self.calls += 1
+        raise LLMProviderError("API 속도 제한에 도달했습니다")
+
+
+def _pending(*paths: str) -> list:
+    return [(i, _chunk(path, "+run()"), path.encode()) for i, path in enumerate(paths)]
+
+
+def test_batch_review_falls_back_only_for_missing_items(analyzer):
+    """JSON 응답에서 누락된 파일만 개별 요청으로 처리"""
+    analyzer.llm = FakeLLM('[{"index": 1, "review": "좋음"}]', "개별 리뷰")
+    results = asyncio.run(analyzer.review_batch_async(_pending("a.py", "b.py"), "system", asyncio.Semaphore(1)))
+    assert [r['review'] for r in results] == ["좋음", "개별 리뷰"]
+    assert analyzer.llm.calls == 2
+
+
+def test_batch_review_reraises_provider_errors(analyzer):
+    """프로바이더 오류 시 파일별 요청을 추가로 보내지 않음"""
+    analyzer.llm = FailingLLM()
+    with pytest.raises(LLMProviderError):
+        asyncio.run(analyzer.review_batch_async(_pending("a.py", "b.py", "c.py"), "system", asyncio.Semaphore(1)))
+    assert analyzer.llm.calls == 1
+
+
+def test_parse_batch_reviews_extracts_and_cleans_items(analyzer):
+    raw = '결과입니다:\n[{"index": 1, "review": "<think>...</think> 좋음"}, {"index": 2, "review": "  "}, {"index": "3", "review": "x"}]\n끝'
+    assert analyzer._parse_batch_reviews(raw) == {1: "... 좋음"}
+
+
+@pytest.mark.parametrize("raw", ["", "리뷰 없음", "[{\"index\": 1,", '{"index": 1, "review": "x"}', None])
+def test_parse_batch_reviews_returns_empty_for_malformed_response(analyzer, raw):
+    assert analyzer._parse_batch_reviews(raw) == {}
+
+
+def test_identical_diffs_are_reviewed_once(analyzer, monkeypatch):
+    """같은 diff를 가진 파일은 첫 파일에서 한 번만 리뷰하고 also_applies_to로 공유"""
+    monkeypatch.setattr(Config, "ENABLE_BATCH_REVIEW", False)
+    analyzer.llm = FakeLLM("리뷰")
+    chunks = [_chunk("a.py", "+run()"), _chunk("b.py", "+run()"), _chunk("c.py", "+stop()")]
+    reviews = analyzer.review_code_changes(chunks)
+    assert [r['file'] for r in reviews] == ["a.py", "c.py"]
+    assert reviews[0]['also_applies_to'] == ["b.py"]
+    assert reviews[1]['also_applies_to'] == []
+    assert analyzer.llm.calls == 2
+
+
+def test_on_review_receives_duplicates_found_after_cached_first_copy(analyzer, monkeypatch):
+    """첫 파일이 캐시 히트여도 on_review는 뒤에 나온 같은 diff의 파일까지 받음"""
+    monkeypatch.setattr(Config, "ENABLE_BATCH_REVIEW", False)
+    first = _chunk("a.py", "+run()")
+    analyzer._set_cached("review", first, analyzer._get_cache_content(first), "캐시된 리뷰")
+    analyzer.llm = FakeLLM("리뷰")
+
+    received = []
+    chunks = iter([first, _chunk("c.py", "+stop()"), _chunk("b.py", "+run()")])
+    analyzer.review_code_changes(chunks, on_review=lambda r: received.append((r['file'], list(r['also_applies_to']))))
+    assert sorted(received) == [("a.py", ["b.py"]), ("c.py", [])]
+    assert analyzer.llm.calls == 1
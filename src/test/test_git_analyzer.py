@@ -0,0 +1,74 @@
+"""GitAnalyzer 변경사항 조회 테스트"""
+
+import subprocess
+
+import pytest
+
+from src.serviceImpl.git_analyzer import GitAnalyzer
+
+
+def _git(repo, *args):
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """커밋 하나와 .gitignore가 있는 임시 저장소"""
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _git(repo, "init", "-q")
+    _git(repo, "config", "user.email", "test@example.com")
+    _git(repo, "config", "user.name", "test")
+    (repo / ".gitignore").write_text("*.log\n", encoding="utf-8")
+    (repo / "main.py").write_text("print('hi')\n", encoding="utf-8")
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-q", "-m", "init")
+    return repo
+
+
+def test_has_changes_is_false_for_clean_tree(repo):
+    assert not GitAnalyzer(str(repo)).has_changes()
+
+
+def test_has_changes_ignores_gitignored_files(repo):
+    (repo / "debug.log").write_text("x\n", encoding="utf-8")
+    assert not GitAnalyzer(str(repo)).has_changes()
+
+
+def test_has_changes_detects_worktree_staged_and_untracked_changes(repo):
+    (repo / "main.py").write_text("print('bye')\n", encoding="utf-8")
+    assert GitAnalyzer(str(repo)).has_changes()
+
+    _git(repo, "add", "main.py")
+    assert GitAnalyzer(str(repo)).has_changes()
+
+    _git(repo, "commit", "-q", "-m", "update")
+    (repo / "new.py").write_text("x = 1\n", encoding="utf-8")
+    assert GitAnalyzer(str(repo)).has_changes()
+
+
+def test_has_changes_on_repository_without_commits(tmp_path):
+    repo = tmp_path / "empty"
+    repo.mkdir()
+    _git(repo, "init", "-q")
+    assert not GitAnalyzer(str(repo)).has_changes()
+    (repo / "a.py").write_text("x = 1\n", encoding="utf-8")
+    assert GitAnalyzer(str(repo)).has_changes()
+
+
+def test_list_untracked_files_respects_gitignore_and_special_names(repo):
+    (repo / "debug.log").write_text("x\n", encoding="utf-8")
+    (repo / "pkg").mkdir()
+    (repo / "pkg" / "mod.py").write_text("x = 1\n", encoding="utf-8")
+    (repo / "공백 있는 파일.py").write_text("x = 1\n", encoding="utf-8")
+
+    untracked = GitAnalyzer(str(repo))._list_untracked_files()
+    assert sorted(untracked) == ["pkg/mod.py", "공백 있는 파일.py"]
+
+
+def test_get_all_changes_reports_untracked_and_modified(repo):
+    (repo / "main.py").write_text("print('bye')\n", encoding="utf-8")
+    (repo / "new.py").write_text("x = 1\n", encoding="utf-8")
+    changes = GitAnalyzer(str(repo)).get_all_changes()
+    assert changes['modified'] == ["main.py"]
+    assert changes['untracked'] == ["new.py"]
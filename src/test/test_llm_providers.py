@@ -0,0 +1,50 @@
+"""LLMProvider 재시도 로직 테스트"""
+
+import pytest
+
+from src.serviceImpl.llm_providers import LLMProvider, RetryableLLMError
+
+
+class FlakyStreamProvider(LLMProvider):
+    """지정한 횟수만큼 실패한 뒤 조각을 스트리밍하는 프로바이더"""
+
+    def __init__(self, failures_before_start: int = 0, fail_after_first_piece: bool = False):
+        super().__init__(max_retries=3, retry_delay=0)
+        self.failures_before_start = failures_before_start
+        self.fail_after_first_piece = fail_after_first_piece
+        self.calls = 0
+
+    def _generate_impl(self, prompt, system_prompt=None):
+        return "".join(self._generate_stream_impl(prompt, system_prompt))
+
+    def _generate_stream_impl(self, prompt, system_prompt=None):
+        self.calls += 1
+        if self.calls <= self.failures_before_start:
+            raise RetryableLLMError("API 속도 제한에 도달했습니다")
+        yield "feat: "
+        if self.fail_after_first_piece:
+            raise RetryableLLMError("API 연결 오류")
+        yield "x"
+
+
+def test_generate_stream_retries_before_first_piece():
+    provider = FlakyStreamProvider(failures_before_start=2)
+    assert "".join(provider.generate_stream("prompt")) == "feat: x"
+    assert provider.calls == 3
+
+
+def test_generate_stream_gives_up_after_max_retries():
+    provider = FlakyStreamProvider(failures_before_start=5)
+    with pytest.raises(RetryableLLMError):
+        list(provider.generate_stream("prompt"))
+    assert provider.calls == 3
+
+
+def test_generate_stream_does_not_retry_after_first_piece():
+    provider = FlakyStreamProvider(fail_after_first_piece=True)
+    pieces = []
+    with pytest.raises(RetryableLLMError):
+        for piece in provider.generate_stream("prompt"):
+            pieces.append(piece)
+    assert pieces == ["feat: "]
+    assert provider.calls == 1
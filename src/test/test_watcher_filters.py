@@ -0,0 +1,76 @@
+"""GitChangeHandler 이벤트 필터링 테스트"""
+
+import os
+import subprocess
+
+import pytest
+from watchdog.events import FileCreatedEvent, FileModifiedEvent, FileMovedEvent
+
+from src.serviceImpl.git_analyzer import GitAnalyzer
+from src.utils.watcher import GitWatcher
+
+
+@pytest.fixture
+def handler(tmp_path):
+    """.gitignore가 있는 임시 저장소를 감시하는 핸들러 (감시 스레드는 시작하지 않음)"""
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    subprocess.run(["git", "init", "-q"], cwd=repo, check=True)
+    (repo / ".gitignore").write_text("*.tmp\nbuild/\n", encoding="utf-8")
+    watcher = GitWatcher(str(repo), GitAnalyzer(str(repo)), None)
+    return watcher.handler
+
+
+def _path(handler, *parts):
+    return os.path.join(handler.repo_root, *parts)
+
+
+def test_modified_source_file_triggers(handler):
+    handler.on_any_event(FileModifiedEvent(_path(handler, "foo.py")))
+    assert handler._dirty.is_set()
+
+
+def test_gitignored_file_is_ignored(handler):
+    handler.on_any_event(FileCreatedEvent(_path(handler, "a.tmp")))
+    handler.on_any_event(FileModifiedEvent(_path(handler, "build", "out.py")))
+    assert not handler._dirty.is_set()
+
+
+def test_atomic_save_from_gitignored_temp_file_triggers(handler):
+    """임시 파일을 실제 파일로 이름 바꾸는 저장은 원본이 무시 대상이어도 분석해야 함"""
+    handler.on_any_event(FileMovedEvent(_path(handler, "a.tmp"), _path(handler, "foo.py")))
+    assert handler._dirty.is_set()
+
+
+def test_move_between_ignored_paths_is_ignored(handler):
+    handler.on_any_event(FileMovedEvent(_path(handler, "a.tmp"), _path(handler, "b.tmp")))
+    assert not handler._dirty.is_set()
+
+
+def test_move_of_tracked_file_into_ignored_path_triggers(handler):
+    """실제 파일이 사라지는 이동은 대상이 무시 대상이어도 분석해야 함"""
+    handler.on_any_event(FileMovedEvent(_path(handler, "foo.py"), _path(handler, "foo.tmp")))
+    assert handler._dirty.is_set()
+
+
+def test_editor_temp_file_is_ignored(handler):
+    handler.on_any_event(FileModifiedEvent(_path(handler, "src", ".x.py.swp")))
+    handler.on_any_event(FileCreatedEvent(_path(handler, "foo~")))
+    handler.on_any_event(FileCreatedEvent(_path(handler, "4913")))
+    assert not handler._dirty.is_set()
+
+
+@pytest.mark.parametrize("src, dest", [
+    (("src", ".x.py.swp"), ("src", "z.py")),
+    (("foo~",), ("foo",)),
+    (("src", ".#z.py"), ("src", "z.py")),
+])
+def test_move_from_editor_temp_file_to_real_file_triggers(handler, src, dest):
+    """임시 파일 이름이 원본이어도 대상이 실제 파일이면 분석해야 함"""
+    handler.on_any_event(FileMovedEvent(_path(handler, *src), _path(handler, *dest)))
+    assert handler._dirty.is_set()
+
+
+def test_move_between_editor_temp_files_is_ignored(handler):
+    handler.on_any_event(FileMovedEvent(_path(handler, ".x.py.swp"), _path(handler, ".x.py.swo")))
+    assert not handler._dirty.is_set()
@@ -0,0 +1,35 @@
+"""JSON 직렬화 유틸리티 (orjson이 있으면 사용, 없으면 표준 json)"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def dumps(obj: Any, sort_keys: bool = False, indent: bool = False) -> bytes:
+    """객체를 UTF-8 JSON 바이트로 직렬화
+
+    sort_keys: 캐시 키처럼 안정적인 표현이 필요할 때
+    indent: 사람이 읽는 설정 파일처럼 2칸 들여쓰기가 필요할 때
+    """
+    if ORJSON_AVAILABLE:
+        option = 0
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, sort_keys=sort_keys, indent=2).encode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, sort_keys=sort_keys, separators=(',', ':')).encode('utf-8')
+
+
+def loads(data: bytes) -> Any:
+    """JSON 바이트(또는 문자열)를 역직렬화"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -1,15 +1,17 @@
 """파일 시스템 변경사항 감시 모듈"""
 
 import time
-import hashlib
 import logging
 import threading
-import queue
-from pathlib import Path
-from typing import Callable, Optional, Set, Dict
+import os
+import re
+from typing import Callable, Optional, Set, Dict, List
 from datetime import datetime
 from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler, FileSystemEvent
+from watchdog.events import (
+    FileSystemEventHandler, FileSystemEvent,
+    EVENT_TYPE_CREATED, EVENT_TYPE_MODIFIED, EVENT_TYPE_MOVED
+)
 from rich.console import Console
 from rich.live import Live
 from rich.panel import Panel
@@ -20,53 +22,78 @@ from ..serviceImpl.commit_analyzer import CommitAnalyzer
 from ..config.config import Config
 # dfsdfasdfsfdsdfsfdsfsdfsdf
 
+try:
+    import pathspec
+    PATHSPEC_AVAILABLE = True
+except ImportError:
+    PATHSPEC_AVAILABLE = False
+
 console = Console()
 
+# 편집기가 저장 중에 만들고 지우는 임시 파일 (Git 상태와 무관하므로 git 조회 전에 무시)
+_EDITOR_TEMP_SUFFIXES = ('.swp', '.swo', '.swx', '~')  # vim 스왑 파일, 백업 파일
+_EDITOR_TEMP_PREFIXES = ('.#',)  # emacs 잠금 파일
+_EDITOR_TEMP_NAMES = frozenset({'4913'})  # vim의 쓰기 권한 확인용 파일
+
+# 정규식의 이름 있는 그룹 시작 부분 (.gitignore 패턴 합치기용)
+_NAMED_GROUP_RE = re.compile(r'\(\?P<\w+>')
+
 # 전역 Progress 락 - 모든 Progress 인스턴스가 공유
 _global_progress_lock = threading.Lock()
 
+# 변경 유형별 패널 표시 형식 (헤더, 파일 앞 접두어, 최대 표시 개수)
+_CHANGE_PANEL_FORMATS = {
+    'added': ("[green]추가: {count}개[/green]", "  + ", 3),
+    'modified': ("[yellow]수정: {count}개[/yellow]", "  M ", 3),
+    'deleted': ("[red]삭제: {count}개[/red]", "  - ", 3),
+    'renamed': ("[blue]이름변경: {count}개[/blue]", "  R ", 2),
+    'untracked': ("[dim]추적안됨: {count}개[/dim]", "  ? ", 3),
+}
+
 
 class PerformanceMonitor:
     """성능 모니터링 클래스"""
     
+    __slots__ = ('total_analyses', 'total_time', 'cache_hits', 'cache_misses', 'errors')
+    
     def __init__(self):
-        self.stats = {
-            'total_analyses': 0,
-            'total_time': 0.0,
-            'cache_hits': 0,
-            'cache_misses': 0,
-            'errors': 0
-        }
+        self.total_analyses = 0
+        self.total_time = 0.0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.errors = 0
         
     def record_analysis(self, duration: float, cache_hit: bool = False):
         """분석 기록"""
-        self.stats['total_analyses'] += 1
-        self.stats['total_time'] += duration
+        self.total_analyses += 1
+        self.total_time += duration
         if cache_hit:
-            self.stats['cache_hits'] += 1
+            self.cache_hits += 1
         else:
-            self.stats['cache_misses'] += 1
+            self.cache_misses += 1
     
     def record_error(self):
         """에러 기록"""
-        self.stats['errors'] += 1
+        self.errors += 1
     
     def get_stats(self) -> Dict[str, any]:
-        """통계 반환"""
-        avg_time = self.stats['total_time'] / max(1, self.stats['total_analyses'])
-        cache_rate = self.stats['cache_hits'] / max(1, self.stats['cache_hits'] + self.stats['cache_misses'])
+        """통계 반환 (표시용 딕셔너리는 요청 시에만 생성)"""
+        avg_time = self.total_time / max(1, self.total_analyses)
+        cache_rate = self.cache_hits / max(1, self.cache_hits + self.cache_misses)
         
         return {
-            '총 분석 횟수': self.stats['total_analyses'],
+            '총 분석 횟수': self.total_analyses,
             '평균 분석 시간': f"{avg_time:.2f}초",
             '캐시 적중률': f"{cache_rate * 100:.1f}%",
-            '오류 발생 횟수': self.stats['errors']
+            '오류 발생 횟수': self.errors
         }
 
 
 class GitChangeHandler(FileSystemEventHandler):
     """Git 저장소 변경사항 처리 핸들러"""
     
+    MAX_DEBOUNCE_FACTOR = 5  # 이벤트가 끊이지 않을 때 최대 대기 시간 (디바운스 시간의 배수)
+    
     def __init__(self, git_analyzer: GitAnalyzer, commit_analyzer: CommitAnalyzer, 
                  on_change_callback: Optional[Callable] = None):
         self.git = git_analyzer
@@ -75,9 +102,14 @@ class GitChangeHandler(FileSystemEventHandler):
         self.last_check_time = time.time()
         self.debounce_seconds = Config.DEBOUNCE_DELAY
         self.pending_check = False
-        self.last_processed_hash = None
-        self._ignored_patterns = set(Config.IGNORE_PATTERNS)
-        self.change_queue = queue.Queue()
+        self.last_processed_snapshot = None  # 마지막으로 분석한 변경사항 스냅샷
+        self._ignore_re = Config.get_ignore_regex()
+        self.repo_root = str(git_analyzer.repo_path)
+        self.ignore_matcher = None  # .gitignore 매처: 상대 경로 -> 무시 여부 (GitWatcher가 설정)
+        self.on_top_level_dir = None  # 저장소 루트에 디렉토리가 생겼을 때 호출 (GitWatcher가 설정)
+        self._dirty = threading.Event()  # 처리되지 않은 변경 이벤트 존재 여부
+        self._last_event_time = 0.0  # 마지막 이벤트 시각 (time.monotonic 기준)
+        self._stopped = threading.Event()  # 처리 스레드 종료 요청
         self.processing_thread = None
         self.running = False
         self.performance = PerformanceMonitor()
@@ -87,13 +119,16 @@ class GitChangeHandler(FileSystemEventHandler):
     def start_processing(self):
         """변경사항 처리 스레드 시작"""
         self.running = True
+        self._stopped.clear()
+        self._dirty.clear()
         self.processing_thread = threading.Thread(target=self._process_changes, daemon=True)
         self.processing_thread.start()
     
     def stop_processing(self):
         """변경사항 처리 스레드 중지"""
         self.running = False
-        self.change_queue.put(None)  # 종료 신호
+        self._stopped.set()
+        self._dirty.set()  # 대기 중인 처리 스레드 깨우기
         if self.processing_thread:
             self.processing_thread.join(timeout=5)
     
@@ -101,9 +136,9 @@ class GitChangeHandler(FileSystemEventHandler):
         """변경사항 처리 (별도 스레드)"""
         while self.running:
             try:
-                # 큐에서 변경사항 가져오기 (타임아웃 설정)
-                item = self.change_queue.get(timeout=1)
-                if item is None:  # 종료 신호
+                # 이벤트가 올 때까지 대기 (종료 시 stop_processing이 깨움)
+                self._dirty.wait()
+                if self._stopped.is_set():
                     break
                     
                 # 이미 처리 중인 경우 건너뛰기
@@ -113,15 +148,11 @@ class GitChangeHandler(FileSystemEventHandler):
                     self.is_processing = True
                 
                 try:
-                    # 디바운싱
-                    time.sleep(self.debounce_seconds)
-                    
-                    # 큐에 있는 중복 항목 제거
-                    while not self.change_queue.empty():
-                        try:
-                            self.change_queue.get_nowait()
-                        except queue.Empty:
-                            break
+                    # 디바운싱: 마지막 이벤트 후 debounce_seconds 동안 조용해질 때까지 대기
+                    if not self._wait_for_quiet():
+                        break
+                    # 콜백 실행 중 들어오는 이벤트는 다음 분석에서 처리
+                    self._dirty.clear()
                     
                     # 변경사항 처리
                     if self.on_change_callback:
@@ -138,62 +169,113 @@ class GitChangeHandler(FileSystemEventHandler):
                     with self._processing_lock:
                         self.is_processing = False
                         
-            except queue.Empty:
-                continue
             except Exception as e:
                 console.print(f"[red]처리 스레드 오류: {e}[/red]")
                 self.performance.record_error()
         
-    def should_ignore(self, path: str) -> bool:
+    def _wait_for_quiet(self) -> bool:
+        """마지막 이벤트 후 debounce_seconds 동안 새 이벤트가 없을 때까지 대기
+
+        이벤트가 계속 들어와도 MAX_DEBOUNCE_FACTOR배 시간이 지나면 분석을 진행합니다.
+        종료 요청을 받으면 False를 반환합니다.
+        """
+        deadline = time.monotonic() + self.debounce_seconds * self.MAX_DEBOUNCE_FACTOR
+        while True:
+            now = time.monotonic()
+            timeout = min(self._last_event_time + self.debounce_seconds, deadline) - now
+            if timeout <= 0:
+                return True
+            if self._stopped.wait(timeout):
+                return False
+        
+    def should_ignore(self, path: str, is_directory: bool = False) -> bool:
         """무시해야 할 파일/디렉토리인지 확인"""
         path_str = str(path)
-        return any(pattern in path_str for pattern in self._ignored_patterns)
+        if self._ignore_re.search(path_str):
+            return True
+        
+        if not is_directory and self._is_editor_temp_file(os.path.basename(path_str)):
+            return True
+        
+        # .gitignore에 해당하는 경로는 Git 상태 조회 전에 걸러냄
+        if self.ignore_matcher is not None:
+            rel_path = os.path.relpath(path_str, self.repo_root).replace(os.sep, '/')
+            if rel_path.startswith('..'):
+                return False
+            if is_directory:
+                rel_path += '/'
+            return bool(self.ignore_matcher(rel_path))
+        return False
+    
+    @staticmethod
+    def _is_editor_temp_file(name: str) -> bool:
+        """편집기 임시 파일인지 확인 (저장할 때마다 이벤트를 만들지만 분석할 변경은 아님)
+
+        이동 이벤트는 대상 경로도 확인하므로, 임시 파일을 실제 파일로 이름 바꾸는 저장은 무시되지 않습니다.
+        """
+        return (name.endswith(_EDITOR_TEMP_SUFFIXES)
+                or name.startswith(_EDITOR_TEMP_PREFIXES)
+                or name in _EDITOR_TEMP_NAMES)
     
-    def _get_changes_hash(self) -> str:
-        """현재 변경사항의 해시값 생성 (SHA-256 사용, 파일 크기 및 수정 시간 포함)"""
+    def _get_changes_snapshot(self, changes: Optional[Dict[str, List[str]]] = None) -> Optional[tuple]:
+        """현재 변경사항의 비교용 스냅샷 생성 (파일 크기 및 수정 시간 포함, 실패 시 None)
+
+        이전 스냅샷과 ==로 바로 비교하므로 문자열 변환이나 해시 계산이 필요 없습니다.
+        이미 조회한 변경사항을 넘기면 Git 상태를 다시 읽지 않습니다.
+        """
         try:
-            changes = self.git.get_all_changes()
+            if changes is None:
+                changes = self.git.get_all_changes()
             
             # 파일 크기와 수정 시간 정보 추가
-            enhanced_changes = {}
-            for change_type, files in changes.items():
-                if change_type in ['modified', 'added', 'untracked']:
+            # 파일마다 Path 객체를 만들지 않도록 문자열 경로로 결합
+            repo_root = self.repo_root
+            snapshot = []
+            for change_type in sorted(changes):
+                files = changes[change_type]
+                if change_type in ('modified', 'added', 'untracked'):
                     file_info = []
                     for file_path in files:
+                        # exists() 확인 없이 바로 stat (없는 파일은 예외로 처리)
                         try:
-                            full_path = Path(self.git.repo_path) / file_path
-                            if full_path.exists():
-                                stat = full_path.stat()
-                                file_info.append({
-                                    'path': file_path,
-                                    'size': stat.st_size,
-                                    'mtime': stat.st_mtime
-                                })
-                            else:
-                                file_info.append({'path': file_path, 'size': 0, 'mtime': 0})
+                            stat = os.stat(os.path.join(repo_root, file_path))
+                            file_info.append((file_path, stat.st_size, stat.st_mtime))
                         except Exception:
-                            file_info.append({'path': file_path, 'size': 0, 'mtime': 0})
-                    enhanced_changes[change_type] = file_info
+                            file_info.append((file_path, 0, 0))
+                    snapshot.append((change_type, tuple(file_info)))
                 else:
-                    enhanced_changes[change_type] = files
-            
-            # 변경사항과 파일 정보를 문자열로 변환하여 해시 생성
-            changes_str = str(sorted(enhanced_changes.items()))
-            return hashlib.sha256(changes_str.encode()).hexdigest()
+                    snapshot.append((change_type, tuple(files)))
+            return tuple(snapshot)
         except Exception:
-            # Git 상태를 읽을 수 없는 경우 현재 시간 기반 해시 반환
-            return hashlib.sha256(str(time.time()).encode()).hexdigest()
+            # Git 상태를 읽을 수 없는 경우 항상 새로운 변경사항으로 취급
+            return None
         
     def on_any_event(self, event: FileSystemEvent):
         """모든 파일 시스템 이벤트 처리"""
-        if self.should_ignore(event.src_path):
+        # 디렉토리 수정 이벤트는 그 안의 파일 이벤트와 중복되므로 무시
+        if event.is_directory and event.event_type == EVENT_TYPE_MODIFIED:
             return
         
-        # 이벤트를 큐에 추가
-        try:
-            self.change_queue.put_nowait(event)
-        except queue.Full:
-            pass  # 큐가 가득 찬 경우 무시
+        # 루트는 비재귀로 감시하므로 새로 생긴 최상위 디렉토리는 따로 감시를 추가
+        if event.is_directory and self.on_top_level_dir is not None:
+            if event.event_type == EVENT_TYPE_CREATED:
+                new_dir = event.src_path
+            elif event.event_type == EVENT_TYPE_MOVED:
+                new_dir = event.dest_path
+            else:
+                new_dir = None
+            if new_dir and os.path.dirname(new_dir) == self.repo_root:
+                self.on_top_level_dir(new_dir)
+        
+        if self.should_ignore(event.src_path, event.is_directory):
+            # 임시 파일에 쓴 뒤 실제 파일로 이름을 바꾸는 원자적 저장은 대상 경로로 판단
+            if event.event_type != EVENT_TYPE_MOVED or self.should_ignore(event.dest_path, event.is_directory):
+                return
+
+        # 처리 스레드는 이벤트 내용 없이 "변경됨" 여부만 사용하므로
+        # 이벤트 객체를 쌓지 않고 시각만 갱신 (git pull 등 대량 이벤트 대비)
+        self._last_event_time = time.monotonic()
+        self._dirty.set()
 
 
 class GitWatcher:
@@ -201,20 +283,88 @@ class GitWatcher:
     
     def __init__(self, repo_path: str, git_analyzer: GitAnalyzer, 
                  commit_analyzer: CommitAnalyzer):
-        self.repo_path = Path(repo_path).resolve()
+        # GitAnalyzer가 이미 resolve한 경로를 그대로 사용 (repo_path 인자는 호환성을 위해 유지)
+        self.repo_path = git_analyzer.repo_path
         self.git = git_analyzer
         self.commit_analyzer = commit_analyzer
         self.observer = Observer()
         self.handler = GitChangeHandler(git_analyzer, commit_analyzer, 
                                       self.on_changes_detected)
+        self.handler.ignore_matcher = self._load_gitignore_matcher()
+        self.handler.on_top_level_dir = self._watch_top_level_dir
+        self._dir_watches = {}  # 최상위 디렉토리 경로 -> ObservedWatch
         self.watching = False
         self.last_analysis_time = None
         self.analysis_count = 0
         self._is_analyzing = False  # 분석 중 상태 추적
         self._analysis_lock = threading.Lock()  # 동시 분석 방지용 락
+        self._stop_event = threading.Event()  # 감시 종료 요청
+        
+    def _schedule_watches(self):
+        """루트는 비재귀로, 최상위 디렉토리는 무시 대상이 아닌 것만 재귀로 감시
         
-    def on_changes_detected(self):
-        """변경사항이 감지되었을 때 실행"""
+        저장소 전체를 재귀 감시하면 .git, node_modules, venv 등 무시할 디렉토리까지
+        하위 디렉토리마다 감시가 걸리므로, 이벤트를 받기 전에 감시 대상에서 제외합니다.
+        """
+        self.observer.schedule(self.handler, str(self.repo_path), recursive=False)
+        try:
+            entries = list(os.scandir(self.repo_path))
+        except OSError:
+            entries = []
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                self._watch_top_level_dir(entry.path)
+    
+    def _watch_top_level_dir(self, path: str):
+        """최상위 디렉토리를 재귀 감시에 추가 (.git 및 무시 대상은 제외)"""
+        # "node_modules/"처럼 슬래시로 끝나는 무시 패턴도 일치하도록 끝에 '/'를 붙여 확인
+        if os.path.basename(path) == '.git' or self.handler.should_ignore(path + '/', is_directory=True):
+            return
+        # 삭제 후 다시 생긴 디렉토리는 기존 감시를 정리하고 새로 등록
+        old_watch = self._dir_watches.pop(path, None)
+        try:
+            if old_watch is not None:
+                self.observer.unschedule(old_watch)
+            self._dir_watches[path] = self.observer.schedule(self.handler, path, recursive=True)
+        except (OSError, KeyError) as e:
+            logging.debug(f"디렉토리 감시 추가 실패: {path} ({e})")
+    
+    def _load_gitignore_matcher(self) -> Optional[Callable[[str], bool]]:
+        """저장소 루트의 .gitignore로 경로 매처 생성 (pathspec 미설치 시 None)"""
+        if not PATHSPEC_AVAILABLE:
+            logging.debug("pathspec이 설치되지 않아 .gitignore 필터링을 건너뜁니다.")
+            return None
+        
+        gitignore_path = self.repo_path / '.gitignore'
+        try:
+            with gitignore_path.open('r', encoding='utf-8', errors='ignore') as f:
+                spec = pathspec.PathSpec.from_lines('gitwildmatch', f)
+        except OSError:
+            return None
+        return self._combine_gitignore_patterns(spec) or spec.match_file
+    
+    @staticmethod
+    def _combine_gitignore_patterns(spec) -> Optional[Callable[[str], bool]]:
+        """부정(!) 패턴이 없으면 모든 패턴을 하나의 정규식으로 합쳐 반환
+        
+        PathSpec.match_file은 이벤트마다 패턴을 파이썬 루프로 하나씩 검사합니다.
+        부정 패턴이 없으면 어느 패턴이든 일치하는 순간 무시 대상이므로 한 번의 검색으로 충분합니다.
+        부정 패턴이 있거나 합칠 수 없으면 None을 반환해 pathspec 평가 순서를 그대로 따릅니다.
+        """
+        patterns = [p for p in spec.patterns if p.include is not None]
+        if not patterns or any(not p.include for p in patterns):
+            return None
+        try:
+            # 패턴마다 같은 이름의 그룹이 있으므로 이름 없는 그룹으로 바꿔서 합침
+            combined = '|'.join(
+                '(?:' + _NAMED_GROUP_RE.sub('(?:', p.regex.pattern) + ')' for p in patterns
+            )
+            return re.compile(combined).match
+        except (AttributeError, TypeError, re.error):
+            return None
+        
+    def on_changes_detected(self, changes: Optional[Dict[str, List[str]]] = None):
+        """변경사항이 감지되었을 때 실행 (이미 조회한 변경사항이 있으면 재사용)"""
         # 이미 분석 중인 경우 건너뛰기
         with self._analysis_lock:
             if self._is_analyzing:
@@ -228,17 +378,19 @@ class GitWatcher:
             
             logging.debug(f"변경사항 감지됨! [{timestamp}]")
             
-            # 변경사항 해시 확인
-            current_hash = self.handler._get_changes_hash()
-            if current_hash == self.handler.last_processed_hash:
+            # 변경사항은 한 번만 조회해 스냅샷 비교와 분석에 함께 사용
+            if changes is None:
+                changes = self.git.get_all_changes()
+            
+            # 이전에 분석한 변경사항과 비교
+            current_snapshot = self.handler._get_changes_snapshot(changes)
+            if current_snapshot is not None and current_snapshot == self.handler.last_processed_snapshot:
                 logging.debug("이미 처리된 변경사항입니다.")
-                logging.debug(f"현재 해시: {current_hash[:8]}...")
                 return
                 
-            logging.debug(f"새로운 변경사항 감지됨 (해시: {current_hash[:8]}...)")
+            logging.debug("새로운 변경사항 감지됨")
             
             # 변경사항 분석
-            changes = self.git.get_all_changes()
             if not any(changes.values()):
                 logging.debug("변경사항이 없습니다.")
                 return
@@ -263,7 +415,7 @@ class GitWatcher:
                     # 커밋 메시지 생성
                     analyze_task = progress.add_task("[cyan]커밋 메시지 생성 중...", total=None)
                     
-                    chunks = self.git.get_diff_chunks()
+                    chunks = self.git.get_diff_chunks(untracked=changes['untracked'])
                     if not chunks:
                         progress.stop()
                         logging.debug("분석할 변경사항이 없습니다.")
@@ -277,18 +429,15 @@ class GitWatcher:
                     
                     # 결과 표시
                     console.print(Panel(
-                        commit_message,
+                        Text(commit_message),
                         title="[bold green]추천 커밋 메시지[/bold green]",
                         border_style="green",
                         padding=(1, 2)
                     ))
                     
-                    # 코드 리뷰 실행 여부 확인
+                    # 코드 리뷰 실행 여부 확인 (AUTO_CODE_REVIEW가 false이면 리뷰를 건너뜀)
                     should_review = Config.AUTO_CODE_REVIEW
-                    
-                    # AUTO_CODE_REVIEW가 false이면 리뷰를 건너뜀
-                    if not Config.AUTO_CODE_REVIEW:
-                        should_review = False
+                    if not should_review:
                         logging.debug("AUTO_CODE_REVIEW=false로 설정되어 코드 리뷰를 건너뜁니다.")
                     
                     if should_review:
@@ -314,10 +463,18 @@ class GitWatcher:
                             if reviews:
                                 console.print(f"\n[bold blue]코드 리뷰 결과 ({len(reviews)}개 파일)[/bold blue]")
                                 for i, review in enumerate(reviews, 1):
+                                    # LLM 출력은 마크업 파싱/하이라이팅 없이 그대로 표시
+                                    body = Text.assemble(
+                                        ("파일:", "yellow"), f" {review['file']}\n",
+                                        ("변경:", "yellow"), f" {review['type']}\n\n",
+                                        review['review']
+                                    )
+                                    if review.get('also_applies_to'):
+                                        body.append("\n\n")
+                                        body.append("동일한 변경:", style="yellow")
+                                        body.append(f" {', '.join(review['also_applies_to'])}")
                                     console.print(Panel(
-                                        f"[yellow]파일:[/yellow] {review['file']}\n"
-                                        f"[yellow]변경:[/yellow] {review['type']}\n\n"
-                                        f"{review['review']}",
+                                        body,
                                         title=f"[bold blue]리뷰 {i}/{len(reviews)}[/bold blue]",
                                         border_style="blue",
                                         padding=(1, 2)
@@ -335,8 +492,8 @@ class GitWatcher:
                     except Exception:
                         pass
             
-            # 성공적으로 처리된 해시 저장
-            self.handler.last_processed_hash = current_hash
+            # 성공적으로 처리된 스냅샷 저장
+            self.handler.last_processed_snapshot = current_snapshot
             self.last_analysis_time = datetime.now()
             
             # 통계 표시
@@ -346,9 +503,8 @@ class GitWatcher:
         except Exception as e:
             console.print(f"[red]분석 중 오류 발생: {e}[/red]")
             self.handler.performance.record_error()
-            # 스택 트레이스 표시 (디버깅용)
-            import traceback
-            logging.debug(f"스택 트레이스: {traceback.format_exc()}")
+            # 스택 트레이스 표시 (디버깅용, DEBUG 레벨일 때만 포맷됨)
+            logging.debug("스택 트레이스:", exc_info=True)
         finally:
             # 분석 상태 해제
             with self._analysis_lock:
@@ -359,40 +515,17 @@ class GitWatcher:
         change_text = []
         total_changes = sum(len(files) for files in changes.values())
         
-        if changes.get('added'):
-            change_text.append(f"[green]추가: {len(changes['added'])}개[/green]")
-            for f in changes['added'][:3]:  # 처음 3개만 표시
-                change_text.append(f"  + {f}")
-            if len(changes['added']) > 3:
-                change_text.append(f"  ... 외 {len(changes['added']) - 3}개")
-                
-        if changes.get('modified'):
-            change_text.append(f"[yellow]수정: {len(changes['modified'])}개[/yellow]")
-            for f in changes['modified'][:3]:
-                change_text.append(f"  M {f}")
-            if len(changes['modified']) > 3:
-                change_text.append(f"  ... 외 {len(changes['modified']) - 3}개")
-                
-        if changes.get('deleted'):
-            change_text.append(f"[red]삭제: {len(changes['deleted'])}개[/red]")
-            for f in changes['deleted'][:3]:
-                change_text.append(f"  - {f}")
-            if len(changes['deleted']) > 3:
-                change_text.append(f"  ... 외 {len(changes['deleted']) - 3}개")
-                
-        if changes.get('renamed'):
-            change_text.append(f"[blue]이름변경: {len(changes['renamed'])}개[/blue]")
-            for old, new in changes['renamed'][:2]:
-                change_text.append(f"  R {old} → {new}")
-            if len(changes['renamed']) > 2:
-                change_text.append(f"  ... 외 {len(changes['renamed']) - 2}개")
-                
-        if changes.get('untracked'):
-            change_text.append(f"[dim]추적안됨: {len(changes['untracked'])}개[/dim]")
-            for f in changes['untracked'][:3]:
-                change_text.append(f"  ? {f}")
-            if len(changes['untracked']) > 3:
-                change_text.append(f"  ... 외 {len(changes['untracked']) - 3}개")
+        for change_type, (header, prefix, limit) in _CHANGE_PANEL_FORMATS.items():
+            files = changes.get(change_type)
+            if not files:
+                continue
+            change_text.append(header.format(count=len(files)))
+            if change_type == 'renamed':
+                change_text.extend(f"{prefix}{old} → {new}" for old, new in files[:limit])
+            else:
+                change_text.extend(prefix + f for f in files[:limit])
+            if len(files) > limit:
+                change_text.append(f"  ... 외 {len(files) - limit}개")
                 
         console.print(Panel(
             "\n".join(change_text),
@@ -419,14 +552,15 @@ class GitWatcher:
             console.print("[yellow]이미 감시 중입니다.[/yellow]")
             return
         
-        # 이전 해시 초기화 (새로운 변경사항 감지를 위해)
-        self.handler.last_processed_hash = None
+        # 이전 스냅샷 초기화 (새로운 변경사항 감지를 위해)
+        self.handler.last_processed_snapshot = None
+        self._stop_event.clear()
         
         # 처리 스레드 시작
         self.handler.start_processing()
         
         # 파일 시스템 감시 시작
-        self.observer.schedule(self.handler, str(self.repo_path), recursive=True)
+        self._schedule_watches()
         self.observer.start()
         self.watching = True
         
@@ -451,13 +585,16 @@ class GitWatcher:
             logging.info("기존 변경사항이 감지되었습니다. 분석을 시작합니다.")
             # 약간의 지연 후 분석 실행
             time.sleep(1)
-            self.on_changes_detected()
+            self.on_changes_detected(current_changes)
         else:
             logging.debug("현재 변경사항이 없습니다.")
         
+        # 주기적으로 깨어나지 않고 종료 요청까지 대기
+        # (Windows에서는 시간 제한 없는 wait가 Ctrl+C로 중단되지 않으므로 짧게 나눠서 대기)
+        wait_timeout = 1.0 if os.name == 'nt' else None
         try:
-            while True:
-                time.sleep(1)
+            while not self._stop_event.wait(wait_timeout):
+                pass
         except KeyboardInterrupt:
             self.stop()
             
@@ -467,6 +604,7 @@ class GitWatcher:
             return
         
         logging.info("감시를 중지하는 중...")
+        self._stop_event.set()
         
         # 처리 스레드 중지
         self.handler.stop_processing()